@@ -0,0 +1,32 @@
+"""ingredients (user_id, name) unique, (user_id, expiration_date) index
+
+기존 테이블에 적용하는 첫 마이그레이션 (테이블은 이미 존재한다고 가정)
+유니크 제약을 걸기 전에 유저별로 같은 이름의 재료가 여러 개면 가장 먼저 등록된 것만 남김
+
+Revision ID: a1c3e5f70001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a1c3e5f70001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(sa.text(
+        "DELETE FROM ingredients WHERE id NOT IN ("
+        "SELECT MIN(id) FROM ingredients GROUP BY user_id, name)"
+    ))
+    op.create_unique_constraint("uq_ingredients_user_id_name", "ingredients", ["user_id", "name"])
+    op.create_index("ix_ingredients_user_id_expiration_date", "ingredients", ["user_id", "expiration_date"])
+
+
+def downgrade():
+    op.drop_index("ix_ingredients_user_id_expiration_date", table_name="ingredients")
+    op.drop_constraint("uq_ingredients_user_id_name", "ingredients", type_="unique")
@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import json
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+# 벤치마크용 가짜 Ollama 서버
+# /api/generate 에 고정된 추천 레시피 JSON을 토큰 단위로 나눠서 응답 (토큰당 지연 시간 설정 가능)
+
+CANNED_RESPONSE = json.dumps({
+    "recipes": [
+        {"food": "김치볶음밥", "use_ingredients": ["김치", "밥", "계란", "대파"]},
+        {"food": "계란말이", "use_ingredients": ["계란", "대파", "당근"]},
+        {"food": "감자조림", "use_ingredients": ["감자", "양파", "마늘"]}
+    ]
+}, ensure_ascii=False)
+
+
+def split_tokens(text: str, count: int) -> list[str]:
+    count = max(1, min(count, len(text)))
+    size = -(-len(text) // count)
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def create_app(token_latency: float = 0.02, tokens: int = 50) -> Starlette:
+    chunks = split_tokens(CANNED_RESPONSE, tokens)
+
+    async def health(request: Request):
+        return PlainTextResponse("Ollama is running")
+
+    async def generate(request: Request):
+        body = await request.json()
+        if "prompt" not in body:
+            # 모델 로드 요청 (warm-up, keep-alive)
+            return JSONResponse({"model": body.get("model"), "response": "", "done": True, "done_reason": "load"})
+
+        usage = {
+            "model": body.get("model"),
+            "done": True,
+            "prompt_eval_count": len(body.get("prompt", "")) // 4,
+            "eval_count": len(chunks),
+        }
+
+        if not body.get("stream", True):
+            await asyncio.sleep(token_latency * len(chunks))
+            return JSONResponse({**usage, "response": CANNED_RESPONSE})
+
+        async def lines():
+            for chunk in chunks:
+                await asyncio.sleep(token_latency)
+                yield json.dumps({"model": body.get("model"), "response": chunk, "done": False}, ensure_ascii=False) + "\n"
+            yield json.dumps({**usage, "response": ""}) + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return Starlette(routes=[
+        Route("/", health),
+        Route("/api/generate", generate, methods=["POST"]),
+    ])
+
+
+# 단독 실행: python benchmarks/fake_ollama.py --port 11434 --token-latency-ms 30
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 Ollama 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--token-latency-ms", type=float, default=20)
+    parser.add_argument("--tokens", type=int, default=50)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.token_latency_ms / 1000, args.tokens), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,359 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+import httpx
+import uvicorn
+
+# 부하 테스트 하네스
+# FastAPI 앱을 로컬 대체 환경(SQLite 또는 로컬 Postgres, fakeredis 또는 로컬 redis, 가짜 Ollama)에 띄우고
+# 고정 동시성으로 로그인 / 식재료 다중 추가 / 목록 조회 / 레시피 추천 혼합 부하를 걸어 엔드포인트별 결과를 JSON으로 출력
+#
+# 사용 예:
+#   pip install -r benchmarks/requirements.txt
+#   python benchmarks/run.py --concurrency 20 --duration 30 --output result.json
+#   python benchmarks/run.py --baseline result.json          (이전 결과와 비교)
+#   python benchmarks/run.py --database-url postgresql+asyncpg://user:pw@localhost/bench --redis-url redis://localhost:6379/15
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "src"))
+sys.path.insert(0, str(BENCH_DIR))
+
+INGREDIENT_NAMES = [
+    "계란", "우유", "대파", "양파", "당근", "감자", "두부", "김치", "돼지고기", "닭가슴살",
+    "소고기", "애호박", "버섯", "마늘", "고추", "콩나물", "시금치", "오이", "토마토", "치즈",
+]
+UNKNOWN_NAMES = ["용과", "아보카도", "비트", "고수"]
+
+DEFAULT_MIX = "login=1,bulk_add=2,list=5,suggest=2,delete=1"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="KNUBOW 백엔드 부하 테스트")
+    parser.add_argument("--database-url", help="기본값: 임시 디렉토리의 SQLite(aiosqlite)")
+    parser.add_argument("--redis-url", help="기본값: fakeredis (프로세스 내부)")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시에 요청하는 가상 유저 수")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"작업별 가중치 (기본값: {DEFAULT_MIX})")
+    parser.add_argument("--token-latency-ms", type=float, default=20, help="가짜 Ollama 토큰당 지연 시간")
+    parser.add_argument("--tokens", type=int, default=50, help="가짜 Ollama 응답 토큰 수")
+    parser.add_argument("--no-recipe-cache", action="store_true", help="레시피 캐시를 끄고 매번 Ollama 호출")
+    parser.add_argument("--app-port", type=int, default=18000)
+    parser.add_argument("--ollama-port", type=int, default=18434)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    return parser.parse_args()
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = float(weight or 1)
+
+    unknown = set(weights) - set(OPERATIONS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 작업: {', '.join(sorted(unknown))}")
+    return {name: weight for name, weight in weights.items() if weight > 0}
+
+
+# 앱 모듈(core.config)을 불러오기 전에 환경 변수 설정
+def configure_env(args, work_dir: Path):
+    database_url = args.database_url or f"sqlite+aiosqlite:///{work_dir / 'bench.db'}"
+    os.environ["POSTGRES_DATABASE_URL"] = database_url
+    os.environ["OLLAMA_URL"] = f"http://127.0.0.1:{args.ollama_port}/api/generate"
+    os.environ["LOG_DIR"] = str(work_dir / "logs")
+    os.environ["RECIPE_CACHE_ENABLED"] = "false" if args.no_recipe_cache else "true"
+
+    if args.redis_url:
+        redis_url = urlparse(args.redis_url)
+        os.environ["REDIS_HOST"] = redis_url.hostname or "127.0.0.1"
+        os.environ["REDIS_PORT"] = str(redis_url.port or 6379)
+        os.environ["REDIS_DB"] = (redis_url.path or "/0").lstrip("/") or "0"
+    else:
+        os.environ.setdefault("REDIS_HOST", "127.0.0.1")
+        os.environ.setdefault("REDIS_PORT", "6379")
+        # fakeredis의 BLMOVE는 빈 목록에서 기다리지 않고 바로 반환해 작업 소비 태스크가 루프를 점유함
+        # (비동기 레시피 작업은 벤치마크 요청 구성에 없으므로 소비 태스크를 띄우지 않음)
+        os.environ.setdefault("RECIPE_JOB_CONSUMERS", "0")
+
+    # .env 없이도 실행되도록 필수 설정은 벤치마크용 값으로 채움
+    defaults = {
+        "SECRET_KEY": "b" * 64,
+        "JWT_ALGORITHM": "HS256",
+        "SESSION_MIDDLEWARE_SECRET_KEY": "bench-session-secret",
+        "MODEL_NAME": "bench-model",
+        "KAKAO_CLIENT_ID": "-", "KAKAO_REDIRECT_URI": "-",
+        "NAVER_CLIENT_ID": "-", "NAVER_CLIENT_SECRET": "-", "NAVER_REDIRECT_URI": "-",
+        "GOOGLE_CLIENT_ID": "-", "GOOGLE_CLIENT_SECRET": "-", "GOOGLE_REDIRECT_URI": "-",
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
+    return database_url
+
+
+# 테이블 생성 + 유통기한 카테고리 시드 (앱 시작 전에 넣어야 CategoryCache가 읽어감)
+async def prepare_database(database_url: str):
+    from sqlalchemy import BigInteger, delete, select
+    from sqlalchemy.ext.compiler import compiles
+
+    if database_url.startswith("sqlite"):
+        # SQLite는 INTEGER PRIMARY KEY만 자동 증가
+        @compiles(BigInteger, "sqlite")
+        def compile_big_integer(type_, compiler, **kw):
+            return "INTEGER"
+
+    from core.connection import AsyncSessionLocal, postgres_engine
+    from database.orm import Base, IngredientCategories, User
+
+    async with postgres_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        admin = await session.scalar(select(User).filter(User.email == "bench-admin@example.com"))
+        if not admin:
+            admin = User(email="bench-admin@example.com", password="-", name="bench", nickname="bench-admin", is_admin=True)
+            session.add(admin)
+            await session.flush()
+
+        await session.execute(delete(IngredientCategories).filter(IngredientCategories.user_id == admin.id))
+        session.add_all([
+            IngredientCategories(user_id=admin.id, ingredient_name=name, default_expiration_days=3 + i % 10)
+            for i, name in enumerate(INGREDIENT_NAMES)
+        ])
+        await session.commit()
+
+
+def use_fake_redis():
+    import fakeredis
+    from core.connection import RedisClient
+
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    RedisClient._redis = fake
+    RedisClient._pool = fake.connection_pool
+
+
+async def start_server(app, port: int) -> tuple[uvicorn.Server, asyncio.Task]:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="on"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+            raise RuntimeError(f"{port} 포트 서버 시작 실패")
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+async def stop_server(server: uvicorn.Server, task: asyncio.Task):
+    server.should_exit = True
+    await task
+
+
+# ------------------- 가상 유저 -------------------
+class VirtualUser:
+    def __init__(self, index: int, client: httpx.AsyncClient, rng: random.Random):
+        self.email = f"bench{index}@example.com"
+        self.password = "bench-password"
+        self.nickname = f"bench{index}"
+        self.client = client
+        self.rng = rng
+        self.token = None
+        self.owned: set[str] = set()
+
+    @property
+    def headers(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    async def sign_up(self):
+        response = await self.client.post("/users/sign-up", json={
+            "email": self.email, "password": self.password, "name": "벤치",
+            "nickname": self.nickname, "birth": "1999-01-01", "gender": "M",
+        })
+        if response.status_code not in (201, 409):
+            response.raise_for_status()
+
+    async def login(self):
+        response = await self.client.post("/users/log-in", json={"email": self.email, "password": self.password})
+        if response.status_code == 200:
+            self.token = response.json()["access_token"]
+        return response
+
+    async def bulk_add(self):
+        names = self.rng.sample(INGREDIENT_NAMES + UNKNOWN_NAMES, 5)
+        body = [
+            {"name": name, "expiration_date": str(date.today() + timedelta(days=self.rng.randint(1, 14))) if self.rng.random() < 0.3 else ""}
+            for name in names
+        ]
+        response = await self.client.post("/ingredients/list", json=body, headers=self.headers)
+        if response.status_code == 200:
+            self.owned.update(names)
+        return response
+
+    async def list(self):
+        return await self.client.get("/ingredients", headers=self.headers)
+
+    async def suggest(self):
+        return await self.client.get("/recipe/suggest", headers=self.headers)
+
+    async def delete(self):
+        if not self.owned:
+            return await self.bulk_add()
+        name = self.rng.choice(sorted(self.owned))
+        self.owned.discard(name)
+        return await self.client.delete(f"/ingredients/{name}", headers=self.headers)
+
+
+OPERATIONS = {
+    "login": VirtualUser.login,
+    "bulk_add": VirtualUser.bulk_add,
+    "list": VirtualUser.list,
+    "suggest": VirtualUser.suggest,
+    "delete": VirtualUser.delete,
+}
+
+
+async def drive(users: list[VirtualUser], mix: dict[str, float], duration: float, rng: random.Random):
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples: dict[str, list[tuple[float, int]]] = {name: [] for name in names}
+    deadline = time.perf_counter() + duration
+
+    async def worker(user: VirtualUser):
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                status = (await OPERATIONS[name](user)).status_code
+            except httpx.HTTPError:
+                status = 0
+            samples[name].append((time.perf_counter() - start, status))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(user) for user in users))
+    return samples, time.perf_counter() - started
+
+
+# ------------------- 결과 집계 -------------------
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples: dict[str, list[tuple[float, int]]], elapsed: float) -> dict:
+    endpoints = {}
+    for name, results in samples.items():
+        latencies = sorted(latency * 1000 for latency, _ in results)
+        errors = sum(1 for _, status in results if not 200 <= status < 400)
+        endpoints[name] = {
+            "count": len(results),
+            "errors": errors,
+            "throughput_rps": round(len(results) / elapsed, 2),
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+                "p50": round(percentile(latencies, 50), 2),
+                "p95": round(percentile(latencies, 95), 2),
+                "p99": round(percentile(latencies, 99), 2),
+                "max": round(latencies[-1], 2) if latencies else 0.0,
+            },
+        }
+
+    total = sum(endpoint["count"] for endpoint in endpoints.values())
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "total_requests": total,
+        "total_errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+        "throughput_rps": round(total / elapsed, 2),
+        "endpoints": endpoints,
+    }
+
+
+# 기준 결과 대비 변화율 (%) - 처리량은 높을수록, 지연 시간은 낮을수록 좋음
+def compare(result: dict, baseline: dict) -> dict:
+    def change(new, old):
+        return round((new - old) / old * 100, 1) if old else None
+
+    comparison = {"throughput_rps_change_pct": change(result["throughput_rps"], baseline["throughput_rps"]), "endpoints": {}}
+    for name, endpoint in result["endpoints"].items():
+        old = baseline["endpoints"].get(name)
+        if not old:
+            continue
+        comparison["endpoints"][name] = {
+            "throughput_rps_change_pct": change(endpoint["throughput_rps"], old["throughput_rps"]),
+            **{
+                f"{key}_change_pct": change(endpoint["latency_ms"][key], old["latency_ms"][key])
+                for key in ("p50", "p95", "p99")
+            },
+        }
+    return comparison
+
+
+async def main(args):
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+
+    with tempfile.TemporaryDirectory(prefix="knubow-bench-") as tmp:
+        database_url = configure_env(args, Path(tmp))
+        await prepare_database(database_url)
+        if not args.redis_url:
+            use_fake_redis()
+
+        from fake_ollama import create_app
+        from main import app
+
+        ollama_server = await start_server(create_app(args.token_latency_ms / 1000, args.tokens), args.ollama_port)
+        app_server = await start_server(app, args.app_port)
+
+        try:
+            limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.app_port}", limits=limits, timeout=120) as client:
+                users = [VirtualUser(i, client, random.Random(rng.random())) for i in range(args.concurrency)]
+                for user in users:
+                    await user.sign_up()
+                    await user.login()
+
+                if args.warmup > 0:
+                    await drive(users, mix, args.warmup, rng)
+                samples, elapsed = await drive(users, mix, args.duration, rng)
+        finally:
+            await stop_server(*app_server)
+            await stop_server(*ollama_server)
+            from core.connection import postgres_engine
+            await postgres_engine.dispose()
+
+    result = {
+        "config": {
+            "database": "sqlite" if database_url.startswith("sqlite") else "postgresql",
+            "redis": "redis" if args.redis_url else "fakeredis",
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "mix": mix,
+            "token_latency_ms": args.token_latency_ms,
+            "tokens": args.tokens,
+            "recipe_cache": not args.no_recipe_cache,
+        },
+        **summarize(samples, elapsed),
+    }
+    if args.baseline:
+        result["comparison"] = compare(result, json.loads(Path(args.baseline).read_text()))
+
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Header, Query, Response
+from typing import List, Literal, Optional
 
 from schema.request import IngredientRequest
 from schema.response import (
@@ -29,11 +29,27 @@ async def create_ingredients(
 ):
     return await service.create_ingredients(requests)
 
+# limit을 주지 않으면 전체 목록 반환, 다음 페이지는 응답의 next_cursor로 요청
+# ETag가 같으면(식재료 변경 없음) 304 반환
 @router.get("", status_code=200, response_model=IngredientListSchema)
 async def get_ingredients(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=200, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    sort: Literal["created", "expiry"] = Query("created", description="created(등록 순) 또는 expiry(유통기한 임박 순)"),
+    if_none_match: Optional[str] = Header(None),
     service: IngredientService = Depends(get_ingredient_service)
 ):
-    return await service.get_ingredients()
+    etag, ingredients = await service.get_ingredients(limit, cursor, sort, if_none_match)
+
+    headers = {"Cache-Control": "private, no-cache"}
+    if etag:
+        headers["ETag"] = etag
+    if ingredients is None:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return ingredients
 
 @router.delete("/{ingredient_name}", status_code=204)
 async def delete_ingredient(
@@ -1,19 +1,43 @@
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Body, Response
+from fastapi.responses import StreamingResponse
 
+from core.config import settings
 from service.recipe.foodthing import CookAIService
-from schema.request import CookingRequest
-from dependencies.di import get_cook_ai_service
+from service.recipe.recipe_jobs import RecipeJobService
+from schema.request import CookingRequest, RecipeJobRequest
+from schema.response import RecipeJobSchema
+from dependencies.di import get_cook_ai_service, get_recipe_job_service
 
 #LLM 관련 라우터
 
 router = APIRouter(prefix="/recipe", tags=["Recipe"])
 
+# SSE 응답 (프록시 버퍼링 방지 헤더 포함)
+def event_stream(events) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# 비동기 작업 상태 응답 헤더 (처리 중이면 Retry-After로 폴링 간격 안내)
+def set_job_headers(response: Response, job: RecipeJobSchema):
+    response.headers["Cache-Control"] = "no-store"
+    if job.status in ("queued", "running"):
+        response.headers["Retry-After"] = str(settings.RECIPE_JOB_RETRY_AFTER)
+
 @router.get("/suggest", status_code=200)
 async def suggest_recipe(
     cook_ai: CookAIService = Depends(get_cook_ai_service),
 ):
     return await cook_ai.get_suggest_recipes()
 
+@router.get("/suggest/stream", status_code=200)
+async def suggest_recipe_stream(
+    cook_ai: CookAIService = Depends(get_cook_ai_service),
+):
+    return event_stream(await cook_ai.get_suggest_recipes(stream=True))
+
 @router.post("/cooking", status_code=200)
 async def cooking_recipe(
     request: CookingRequest,
@@ -21,6 +45,13 @@ async def cooking_recipe(
 ):
     return await cook_ai.get_food_recipe(request.model_dump())
 
+@router.post("/cooking/stream", status_code=200)
+async def cooking_recipe_stream(
+    request: CookingRequest,
+    cook_ai: CookAIService = Depends(get_cook_ai_service)
+):
+    return event_stream(await cook_ai.get_food_recipe(request.model_dump(), stream=True))
+
 @router.post("/quick", status_code=200)
 async def quick_recipe(
     chat: str = Body(..., media_type="text/plain"),
@@ -28,9 +59,45 @@ async def quick_recipe(
 ):
     return await cook_ai.get_quick_recipe(chat)
 
+@router.post("/quick/stream", status_code=200)
+async def quick_recipe_stream(
+    chat: str = Body(..., media_type="text/plain"),
+    cook_ai: CookAIService = Depends(get_cook_ai_service)
+):
+    return event_stream(await cook_ai.get_quick_recipe(chat, stream=True))
+
 @router.post("/search", status_code=200)
 async def search_recipe(
     chat: str = Body(..., media_type="text/plain"),
     cook_ai: CookAIService = Depends(get_cook_ai_service)
 ):
-    return await cook_ai.get_search_recipe(chat)
\ No newline at end of file
+    return await cook_ai.get_search_recipe(chat)
+
+@router.post("/search/stream", status_code=200)
+async def search_recipe_stream(
+    chat: str = Body(..., media_type="text/plain"),
+    cook_ai: CookAIService = Depends(get_cook_ai_service)
+):
+    return event_stream(await cook_ai.get_search_recipe(chat, stream=True))
+
+# 비동기 레시피 작업: 바로 job_id를 반환하고, 결과는 GET /recipe/jobs/{job_id}로 조회
+@router.post("/jobs", status_code=202)
+async def create_recipe_job(
+    request: RecipeJobRequest,
+    response: Response,
+    job_service: RecipeJobService = Depends(get_recipe_job_service)
+):
+    job = await job_service.submit_job(request.model_dump())
+    response.headers["Location"] = f"{router.prefix}/jobs/{job.job_id}"
+    set_job_headers(response, job)
+    return job
+
+@router.get("/jobs/{job_id}", status_code=200)
+async def get_recipe_job(
+    job_id: str,
+    response: Response,
+    job_service: RecipeJobService = Depends(get_recipe_job_service)
+):
+    job = await job_service.get_job(job_id)
+    set_job_headers(response, job)
+    return job
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from sqlalchemy import select
+
+from cache.invalidation import InvalidationBus
+from core.config import settings
+from core.connection import AsyncSessionLocal
+from core.logging import loggers
+from database.orm import IngredientCategories
+
+# 유통기한 카테고리 프로세스 내 캐시 (식재료 추가마다 ingredient_categories 조회하지 않기 위함)
+# - 앱 시작 시 전체 로드, CATEGORY_CACHE_TTL 지나면 다시 로드
+# - 관리자가 카테고리를 수정하면 Redis pub/sub으로 모든 워커의 캐시 무효화
+
+background_logger = loggers["background"]
+
+class CategoryCache:
+    CHANNEL = "ingredient_categories"
+
+    _expirations: dict[str, int] = {}   # ingredient_name -> default_expiration_days
+    _loaded_at: float | None = None
+    _lock: asyncio.Lock | None = None
+
+    @classmethod
+    async def load(cls):
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(IngredientCategories.ingredient_name, IngredientCategories.default_expiration_days)
+            )
+            cls._expirations = dict(result.all())
+        cls._loaded_at = time.monotonic()
+
+    @classmethod
+    def _is_stale(cls) -> bool:
+        return cls._loaded_at is None or time.monotonic() - cls._loaded_at > settings.CATEGORY_CACHE_TTL
+
+    @classmethod
+    async def get_expirations(cls) -> dict[str, int]:
+        if cls._is_stale():
+            if cls._lock is None:
+                cls._lock = asyncio.Lock()
+            async with cls._lock:
+                if cls._is_stale():  # 락 대기 중 다른 요청이 이미 로드했으면 생략
+                    await cls.load()
+        return cls._expirations
+
+    @classmethod
+    def invalidate(cls, payload: str | None = None):
+        cls._loaded_at = None
+
+    # 카테고리 변경 커밋 후 호출 -> 현재 워커 + 다른 워커 캐시 무효화
+    @classmethod
+    async def publish_invalidation(cls):
+        cls.invalidate()
+        await InvalidationBus.publish(cls.CHANNEL)
+
+    @classmethod
+    async def start(cls):
+        try:
+            await cls.load()
+            background_logger.info(f"유통기한 카테고리 캐시 로드 완료 ({len(cls._expirations)}개)")
+        except Exception as e:
+            background_logger.error(f"유통기한 카테고리 캐시 로드 실패 (요청 시 다시 로드): {e}")
+
+InvalidationBus.register(CategoryCache.CHANNEL, CategoryCache.invalidate)
@@ -0,0 +1,70 @@
+import json
+import time
+
+from core.config import settings
+from core.connection import RedisClient
+from core.logging import loggers
+
+# 유저별 식재료 목록 스냅샷 캐시
+# 식재료 추가/삭제 시 버전을 올려서 이전 스냅샷(및 그 스냅샷 기준 추천 결과)을 자동으로 무효화
+
+error_logger = loggers["error"]
+
+class IngredientCache:
+    VERSION_PREFIX = "ingredients:version:"
+    SNAPSHOT_PREFIX = "ingredients:snapshot:"
+    VERSION_TTL = 60 * 60 * 24 * 30
+
+    @classmethod
+    async def get_version(cls, user_id: int) -> str | None:
+        key = f"{cls.VERSION_PREFIX}{user_id}"
+        try:
+            redis = await RedisClient.get_redis()
+            version = await redis.get(key)
+            if version is None:
+                # 키가 없으면 현재 시각으로 시작 (만료 후 재생성돼도 예전 버전과 겹치지 않음)
+                await redis.set(key, time.time_ns(), nx=True, ex=cls.VERSION_TTL)
+                version = await redis.get(key)
+            return version
+        except Exception as e:
+            error_logger.warning(f"[IngredientCache] 버전 조회 실패: {e}")
+            return None
+
+    @classmethod
+    async def invalidate(cls, user_id: int):
+        key = f"{cls.VERSION_PREFIX}{user_id}"
+        try:
+            redis = await RedisClient.get_redis()
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.set(key, time.time_ns(), nx=True)
+                pipe.incr(key)
+                pipe.expire(key, cls.VERSION_TTL)
+                await pipe.execute()
+        except Exception as e:
+            error_logger.warning(f"[IngredientCache] 버전 갱신 실패 (user_id={user_id}): {e}")
+
+    @classmethod
+    async def get_names(cls, user_id: int, version: str | None) -> list[str] | None:
+        if version is None:
+            return None
+        try:
+            redis = await RedisClient.get_redis()
+            cached = await redis.get(f"{cls.SNAPSHOT_PREFIX}{user_id}:{version}")
+        except Exception as e:
+            error_logger.warning(f"[IngredientCache] 스냅샷 조회 실패: {e}")
+            return None
+        return json.loads(cached) if cached else None
+
+    @classmethod
+    async def set_names(cls, user_id: int, version: str | None, names: list[str]):
+        if version is None:
+            return
+        try:
+            redis = await RedisClient.get_redis()
+            await redis.set(
+                f"{cls.SNAPSHOT_PREFIX}{user_id}:{version}",
+                json.dumps(names, ensure_ascii=False),
+                ex=settings.INGREDIENT_SNAPSHOT_TTL
+            )
+        except Exception as e:
+            error_logger.warning(f"[IngredientCache] 스냅샷 저장 실패: {e}")
@@ -0,0 +1,80 @@
+import asyncio
+
+from core.connection import RedisClient
+from core.logging import loggers
+
+# 프로세스 내 캐시를 모든 워커에서 함께 무효화하기 위한 Redis pub/sub 채널 관리
+# handler(payload)는 메시지를 받으면 호출되고, 구독이 끊겼다 다시 연결되면 payload=None으로 호출됨
+# (끊긴 사이 놓친 메시지가 있을 수 있으므로 전체 무효화)
+
+background_logger = loggers["background"]
+
+class InvalidationBus:
+    CHANNEL_PREFIX = "cache:invalidate:"
+
+    _handlers: dict = {}
+    _listener: asyncio.Task | None = None
+
+    @classmethod
+    def register(cls, name: str, handler):
+        cls._handlers[cls.CHANNEL_PREFIX + name] = handler
+
+    @classmethod
+    async def publish(cls, name: str, payload: str = ""):
+        try:
+            redis = await RedisClient.get_redis()
+            await redis.publish(cls.CHANNEL_PREFIX + name, payload)
+        except Exception as e:
+            background_logger.warning(f"[InvalidationBus] 무효화 메시지 발행 실패 ({name}): {e}")
+
+    @classmethod
+    def _dispatch(cls, channel, payload):
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+
+        handler = cls._handlers.get(channel)
+        if handler:
+            handler(payload)
+
+    @classmethod
+    async def _listen(cls):
+        reconnect = False
+        while True:
+            try:
+                redis = await RedisClient.get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(*cls._handlers)
+                if reconnect:
+                    for handler in cls._handlers.values():
+                        handler(None)
+                reconnect = True
+                try:
+                    # listen()은 REDIS_SOCKET_TIMEOUT에 걸려 끊기므로 짧은 timeout으로 반복 확인
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message and message["type"] == "message":
+                            cls._dispatch(message["channel"], message["data"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                background_logger.warning(f"[InvalidationBus] 무효화 채널 구독 오류, 5초 후 재시도: {e}")
+                await asyncio.sleep(5)
+
+    @classmethod
+    async def start(cls):
+        if cls._handlers:
+            cls._listener = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def stop(cls):
+        if cls._listener:
+            cls._listener.cancel()
+            try:
+                await cls._listener
+            except asyncio.CancelledError:
+                pass
+            cls._listener = None
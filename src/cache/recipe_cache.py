@@ -0,0 +1,70 @@
+import hashlib
+import json
+import time
+
+from core.config import settings
+from core.connection import RedisClient
+from core.logging import loggers
+
+# LLM 레시피 결과 캐시 (같은 입력이면 Ollama 호출 없이 Redis에서 반환)
+
+error_logger = loggers["error"]
+
+class RecipeCache:
+    KEY_PREFIX = "recipe:cache:"
+    INDEX_KEY = "recipe:cache:index"    # 저장 시각 기준 정렬 (용량 초과 시 오래된 것부터 삭제)
+
+    # 공백 정리 + 대소문자 통일
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        return " ".join(text.split()).casefold()
+
+    @classmethod
+    def normalize_list(cls, items: list) -> list:
+        return sorted({cls.normalize_text(item) for item in items if item and item.strip()})
+
+    # 모델명 + 프롬프트 버전 + 정규화된 입력으로 키 생성
+    @classmethod
+    def make_key(cls, kind: str, template_version, *inputs) -> str:
+        raw = json.dumps(
+            [settings.MODEL_NAME, kind, template_version, inputs],
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return cls.KEY_PREFIX + hashlib.sha256(raw.encode()).hexdigest()
+
+    @classmethod
+    async def get(cls, key: str):
+        if not settings.RECIPE_CACHE_ENABLED:
+            return None
+
+        try:
+            redis = await RedisClient.get_redis()
+            cached = await redis.get(key)
+        except Exception as e:
+            error_logger.warning(f"[RecipeCache] 캐시 조회 실패: {e}")
+            return None
+
+        return json.loads(cached) if cached else None
+
+    @classmethod
+    async def set(cls, key: str, value):
+        # 에러 응답({"error": ...})은 캐시하지 않음
+        if not settings.RECIPE_CACHE_ENABLED or (isinstance(value, dict) and "error" in value):
+            return
+
+        try:
+            redis = await RedisClient.get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, json.dumps(value, ensure_ascii=False), ex=settings.RECIPE_CACHE_TTL)
+                pipe.zadd(cls.INDEX_KEY, {key: time.time()})
+                pipe.zcard(cls.INDEX_KEY)
+                *_, size = await pipe.execute()
+
+            overflow = size - settings.RECIPE_CACHE_MAX_ENTRIES
+            if overflow > 0:
+                evicted = [member for member, _ in await redis.zpopmin(cls.INDEX_KEY, overflow)]
+                if evicted:
+                    await redis.delete(*evicted)
+        except Exception as e:
+            error_logger.warning(f"[RecipeCache] 캐시 저장 실패: {e}")
@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import json
+import uuid
+
+from core.config import settings
+from core.connection import RedisClient
+from core.logging import loggers
+from exception.base_exception import CustomException
+from exception.foodthing_exception import AIServiceException
+
+# 동일한 LLM 요청이 동시에 여러 번 들어오면 한 번만 생성하고 결과를 공유
+# - 같은 워커: 진행 중인 Task를 함께 기다림
+# - 다른 워커: Redis 락을 잡은 워커만 생성하고, 나머지는 결과 키를 기다림
+#   (결과 키는 락 토큰별로 저장 -> 이전 생성의 결과나 에러를 현재 생성 결과로 착각하지 않음)
+
+error_logger = loggers["error"]
+
+# 락 주인만 해제하도록 토큰 비교 후 삭제
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# 락 주인일 때만 만료 시간 연장
+RENEW_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+class SingleFlight:
+    LOCK_PREFIX = "llm:flight:lock:"
+    RESULT_PREFIX = "llm:flight:result:"  # + key + ":" + 락 토큰
+
+    _inflight: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def make_key(prompt: str) -> str:
+        return hashlib.sha256(f"{settings.MODEL_NAME}\n{prompt}".encode()).hexdigest()
+
+    @classmethod
+    async def run(cls, key: str, func):
+        task = cls._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(cls._run_across_workers(key, func))
+            cls._inflight[key] = task
+            task.add_done_callback(lambda t: cls._on_done(key, t))
+
+        # 한 요청이 취소(클라이언트 연결 끊김)되어도 공유 중인 생성 작업은 계속 진행
+        return await asyncio.shield(task)
+
+    @classmethod
+    def _on_done(cls, key: str, task: asyncio.Task):
+        cls._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # 기다리는 요청이 없어도 경고 로그 남지 않도록 예외 회수
+
+    @classmethod
+    async def _run_across_workers(cls, key: str, func):
+        lock_key = cls.LOCK_PREFIX + key
+        result_key = cls.RESULT_PREFIX + key + ":"
+        token = uuid.uuid4().hex
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.SINGLE_FLIGHT_WAIT_TIMEOUT
+
+        try:
+            redis = await RedisClient.get_redis()
+        except Exception as e:
+            error_logger.warning(f"[SingleFlight] Redis 연결 실패, 단독 실행: {e}")
+            return await func()
+
+        while True:
+            try:
+                acquired = await redis.set(lock_key, token, nx=True, ex=settings.SINGLE_FLIGHT_LOCK_TTL)
+            except Exception as e:
+                error_logger.warning(f"[SingleFlight] 락 획득 실패, 단독 실행: {e}")
+                return await func()
+
+            if acquired:
+                return await cls._lead(redis, lock_key, result_key + token, token, func)
+
+            # 다른 워커가 생성 중 -> 락 주인의 결과가 올라오거나 락이 사라질 때까지 대기
+            owner = None
+            while loop.time() < deadline:
+                owner = await redis.get(lock_key) or owner
+                if owner:
+                    shared = await redis.get(result_key + owner)
+                    if shared:
+                        return cls._unpack(shared)
+                if not await redis.exists(lock_key):
+                    break  # 락 주인이 결과 없이 종료됨 -> 다시 락 획득 시도
+                await asyncio.sleep(settings.SINGLE_FLIGHT_POLL_INTERVAL)
+            else:
+                raise AIServiceException(detail="동일한 AI 요청의 응답 대기 시간이 초과되었습니다")
+
+    # 생성은 대기열 대기 + Ollama 호출이라 락 TTL보다 길어질 수 있음 -> 끝날 때까지 주기적으로 연장
+    # (락 주인 워커가 죽으면 연장이 멈춰 TTL 뒤 다른 워커가 이어받음)
+    @staticmethod
+    async def _keep_lock(redis, lock_key: str, token: str):
+        while True:
+            await asyncio.sleep(settings.SINGLE_FLIGHT_LOCK_TTL / 3)
+            try:
+                await redis.eval(RENEW_LOCK_SCRIPT, 1, lock_key, token, settings.SINGLE_FLIGHT_LOCK_TTL)
+            except Exception as e:
+                error_logger.warning(f"[SingleFlight] 락 연장 실패: {e}")
+
+    @classmethod
+    async def _lead(cls, redis, lock_key: str, result_key: str, token: str, func):
+        renewer = asyncio.create_task(cls._keep_lock(redis, lock_key, token))
+        try:
+            result = await func()
+        except CustomException as e:
+            # 같은 요청을 기다리던 다른 워커에게도 동일한 에러 전달 (Retry-After 등 헤더 포함)
+            await cls._share(redis, result_key, {
+                "error": {
+                    "status_code": e.status_code,
+                    "code": e.code,
+                    "detail": e.detail,
+                    "headers": e.headers
+                }
+            })
+            raise
+        else:
+            await cls._share(redis, result_key, {"result": result})
+            return result
+        finally:
+            renewer.cancel()
+            try:
+                await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except Exception as e:
+                error_logger.warning(f"[SingleFlight] 락 해제 실패: {e}")
+
+    @staticmethod
+    async def _share(redis, result_key: str, data: dict):
+        try:
+            await redis.set(result_key, json.dumps(data, ensure_ascii=False), ex=settings.SINGLE_FLIGHT_RESULT_TTL)
+        except Exception as e:
+            error_logger.warning(f"[SingleFlight] 결과 공유 실패: {e}")
+
+    @staticmethod
+    def _unpack(shared: str):
+        data = json.loads(shared)
+        if "error" in data:
+            # 원래 예외 종류 대신 상태 코드, 에러 코드, 헤더(Retry-After 등)를 그대로 담은 CustomException으로 전달
+            error = data["error"]
+            raise CustomException(error["status_code"], error["detail"], error["code"], error.get("headers"))
+        return data["result"]
@@ -0,0 +1,94 @@
+import time
+
+from collections import OrderedDict
+
+from cache.invalidation import InvalidationBus
+from core.config import settings
+from core.connection import RedisClient
+from core.logging import loggers
+from schema.response import AuthUserSchema
+
+# 인증된 유저 정보 캐시 (보호된 API마다 users 테이블 조회하지 않기 위함)
+# - 1차: 프로세스 내 LRU (USER_CACHE_TTL 동안 유지)
+# - 2차: Redis (USER_CACHE_REDIS=True일 때, 워커 간 공유)
+#   Redis에서 가져온 항목은 Redis에 남은 TTL까지만 로컬에 보관 (최대 USER_CACHE_TTL을 넘겨 오래된 정보 사용 방지)
+# 비밀번호 해시 등 민감 정보는 캐시하지 않고 id, email, is_admin만 저장
+
+error_logger = loggers["error"]
+
+class UserCache:
+    KEY_PREFIX = "user:identity:"
+    CHANNEL = "user_identity"
+
+    _local: OrderedDict = OrderedDict()  # email -> (만료 시각, AuthUserSchema)
+
+    @classmethod
+    async def get(cls, email: str) -> AuthUserSchema | None:
+        entry = cls._local.get(email)
+        if entry:
+            expires_at, user = entry
+            if expires_at > time.monotonic():
+                cls._local.move_to_end(email)
+                return user
+            cls._local.pop(email, None)
+
+        if not settings.USER_CACHE_REDIS:
+            return None
+
+        try:
+            redis = await RedisClient.get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.get(cls.KEY_PREFIX + email)
+                pipe.pttl(cls.KEY_PREFIX + email)
+                cached, pttl = await pipe.execute()
+        except Exception as e:
+            error_logger.warning(f"[UserCache] 캐시 조회 실패: {e}")
+            return None
+
+        if not cached:
+            return None
+
+        user = AuthUserSchema.model_validate_json(cached)
+        if pttl > 0:
+            cls._set_local(user, min(pttl / 1000, settings.USER_CACHE_TTL))
+        return user
+
+    @classmethod
+    async def set(cls, user: AuthUserSchema):
+        cls._set_local(user)
+
+        if not settings.USER_CACHE_REDIS:
+            return
+
+        try:
+            redis = await RedisClient.get_redis()
+            await redis.set(cls.KEY_PREFIX + user.email, user.model_dump_json(), ex=settings.USER_CACHE_TTL)
+        except Exception as e:
+            error_logger.warning(f"[UserCache] 캐시 저장 실패: {e}")
+
+    @classmethod
+    def _set_local(cls, user: AuthUserSchema, ttl: float | None = None):
+        cls._local[user.email] = (time.monotonic() + (ttl or settings.USER_CACHE_TTL), user)
+        cls._local.move_to_end(user.email)
+        while len(cls._local) > settings.USER_CACHE_MAX_SIZE:
+            cls._local.popitem(last=False)
+
+    @classmethod
+    def _drop_local(cls, email: str | None):
+        if email is None:
+            cls._local.clear()
+        else:
+            cls._local.pop(email, None)
+
+    # 비밀번호 변경, 관리자 권한 변경 등 유저 정보가 바뀐 뒤 호출 (모든 워커에서 삭제)
+    @classmethod
+    async def invalidate(cls, email: str):
+        cls._drop_local(email)
+        try:
+            redis = await RedisClient.get_redis()
+            await redis.delete(cls.KEY_PREFIX + email)
+        except Exception as e:
+            error_logger.warning(f"[UserCache] 캐시 삭제 실패: {e}")
+        await InvalidationBus.publish(cls.CHANNEL, email)
+
+InvalidationBus.register(UserCache.CHANNEL, UserCache._drop_local)
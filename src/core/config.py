@@ -23,12 +23,88 @@ class Settings(BaseSettings):
     # recipe.py
     OLLAMA_URL: str
     MODEL_NAME: str
+    OLLAMA_TIMEOUT: float = 50.0
+    OLLAMA_CONNECT_TIMEOUT: float = 5.0
+    OLLAMA_MAX_CONNECTIONS: int = 20
+    OLLAMA_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    OLLAMA_KEEPALIVE_EXPIRY: float = 60.0
+    OLLAMA_HTTP2: bool = True  # h2 패키지가 설치되어 있고 https 엔드포인트일 때만 적용
+    OLLAMA_HEALTH_INTERVAL: float = 10.0
+    OLLAMA_HEALTH_TIMEOUT: float = 3.0
+    OLLAMA_KEEP_ALIVE: str = "30m"             # 마지막 요청 후 모델을 메모리에 유지할 시간 (모든 generate 요청에 전달)
+
+    # ollama_router.py
+    OLLAMA_BACKENDS: str = ""                  # "http://gpu1:11434=2,http://cpu1:11434=1" (URL=가중치), 비어 있으면 OLLAMA_URL만 사용
+    OLLAMA_EJECT_FAILURES: int = 3             # 연속 실패가 이 횟수가 되면 노드 제외
+    OLLAMA_EJECT_SECONDS: float = 30.0         # 제외 후 다시 요청을 보내기까지의 시간
+
+    # ollama_warmup.py
+    OLLAMA_WARMUP_ENABLED: bool = True         # 앱 시작 시 모델 미리 로드
+    OLLAMA_WARMUP_TIMEOUT: float = 120.0       # 모델 로드 대기 시간(초), 넘으면 로드 완료를 기다리지 않고 시작
+    OLLAMA_KEEPALIVE_PING_INTERVAL: float = 600.0   # OLLAMA_KEEP_ALIVE보다 짧게
+    OLLAMA_BUSINESS_HOUR_START: int = 9        # 영업 시간(KST)에만 모델 유지 ping
+    OLLAMA_BUSINESS_HOUR_END: int = 24
+
+    # recipe_cache.py
+    RECIPE_CACHE_ENABLED: bool = True
+    RECIPE_CACHE_TTL: int = 60 * 60 * 24
+    RECIPE_CACHE_MAX_ENTRIES: int = 5000
+
+    # ingredient_cache.py
+    INGREDIENT_SNAPSHOT_TTL: int = 60 * 60
+
+    # category_cache.py
+    CATEGORY_CACHE_TTL: int = 60 * 5
+
+    # executor.py (bcrypt 해싱/검증 전용 스레드 수)
+    PASSWORD_HASH_POOL_SIZE: int = 4
+
+    # user_cache.py
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_REDIS: bool = True
+
+    # single_flight.py
+    SINGLE_FLIGHT_LOCK_TTL: int = 15           # 생성 중에는 TTL/3마다 연장, 락 주인이 죽으면 이 시간 뒤 다른 워커가 이어받음
+    SINGLE_FLIGHT_RESULT_TTL: int = 30
+    SINGLE_FLIGHT_WAIT_TIMEOUT: float = 180.0  # LLM_QUEUE_TIMEOUT + max(OLLAMA_TIMEOUT, OLLAMA_WARMUP_TIMEOUT)보다 길게 (시작 시 검사)
+    SINGLE_FLIGHT_POLL_INTERVAL: float = 0.2
+
+    # admission.py (워커당 Ollama 동시 처리 제한)
+    LLM_MAX_INFLIGHT: int = 4                  # Ollama 노드 1대당 (노드 수만큼 늘어남)
+    LLM_MAX_QUEUE: int = 32
+    LLM_QUEUE_TIMEOUT: float = 30.0
+    LLM_RETRY_AFTER: int = 5
+
+    # recipe_jobs.py (비동기 레시피 작업 큐)
+    RECIPE_JOB_CONSUMERS: int = 4              # 워커당 작업을 꺼내 처리하는 백그라운드 태스크 수 (LLM_MAX_INFLIGHT 이하 권장)
+    RECIPE_JOB_MAX_QUEUE: int = 200            # 대기 중인 작업이 이보다 많으면 429
+    RECIPE_JOB_TTL: int = 3600                 # 작업 상태와 결과 보관 시간(초)
+    RECIPE_JOB_POLL_TIMEOUT: int = 1           # BRPOP 대기 시간(초), REDIS_SOCKET_TIMEOUT보다 짧게
+    RECIPE_JOB_RETRY_AFTER: int = 2            # 클라이언트 폴링 간격 안내 (Retry-After)
+    RECIPE_JOB_STALE_SECONDS: int = 300        # 상태 갱신 없이 이 시간이 지난 queued/running 작업은 실패 처리 (대기열 최대 대기 시간 겸함)
+    RECIPE_JOB_WORKER_TTL: int = 30            # 워커 생존 표시 TTL, 만료된 워커의 처리 중 작업은 다음 워커 시작 시 대기열로 되돌림
 
     # connection.py
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50            # 워커당 최대 커넥션 수
+    REDIS_POOL_TIMEOUT: float = 5.0            # 커넥션이 모두 사용 중일 때 기다릴 최대 시간(초)
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
     POSTGRES_DATABASE_URL: str
+    DB_POOL_SIZE: int = 5                 # 워커당 유지할 커넥션 수
+    DB_MAX_OVERFLOW: int = 10             # 풀이 꽉 찼을 때 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0         # 커넥션을 얻기까지 기다릴 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800           # 오래된 커넥션 재생성 주기(초)
+    DB_POOL_PRE_PING: bool = True         # 커넥션 사용 전 끊김 여부 확인
+    DB_STATEMENT_CACHE_SIZE: int = 100    # asyncpg prepared statement 캐시 크기 (pgbouncer 사용 시 0)
+    SLOW_QUERY_THRESHOLD_MS: float = 200  # 이 시간 이상 걸린 쿼리는 slow_query.log에 기록
+
+    # access_logging.py
+    SERVER_TIMING_ENABLED: bool = False   # 응답에 Server-Timing 헤더(DB 쿼리 수, 시간) 추가
 
     # main.py
     SESSION_MIDDLEWARE_SECRET_KEY: SecretStr
@@ -1,38 +1,190 @@
-import aioredis
+import httpx
+import time
+import redis.asyncio as aioredis
 
+from importlib.util import find_spec
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from core.config import settings
+from core.logging import loggers
+from core.query_stats import current_query_stats
+from core.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_IN_USE,
+    DB_POOL_OVERFLOW,
+    DB_POOL_TIMEOUTS,
+    DB_QUERIES,
+    DB_QUERY_DURATION,
+    REDIS_POOL_WAIT,
+    REDIS_POOL_IN_USE,
+    REDIS_COMMAND_LATENCY
+)
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 #연결 설정, 세션 관리
 
+# 커넥션을 얻기까지 기다린 시간 기록용 풀
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
 # PostgreSQL 연결 설정 (비동기식)
 POSTGRES_DATABASE_URL = settings.POSTGRES_DATABASE_URL
-postgres_engine = create_async_engine(POSTGRES_DATABASE_URL)
+postgres_engine = create_async_engine(
+    POSTGRES_DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=(
+        {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+        if POSTGRES_DATABASE_URL.startswith("postgresql+asyncpg") else {}
+    ),
+)
 AsyncSessionLocal = sessionmaker(
     bind=postgres_engine,
     expire_on_commit=False,
     class_=AsyncSession
 )
 
+# 풀 사용 현황 (사용 중인 커넥션 수, 초과 생성된 커넥션 수)
+@event.listens_for(postgres_engine.sync_engine, "checkout")
+def on_pool_checkout(*args):
+    pool = postgres_engine.sync_engine.pool
+    DB_POOL_IN_USE.inc()
+    DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+# checkin 이벤트는 커넥션이 풀에 반환되기 직전에 발생 (풀이 가득 차 있으면 초과 커넥션은 닫힘)
+@event.listens_for(postgres_engine.sync_engine, "checkin")
+def on_pool_checkin(*args):
+    pool = postgres_engine.sync_engine.pool
+    DB_POOL_IN_USE.dec()
+    closing_overflow = 1 if pool.checkedin() >= pool.size() else 0
+    DB_POOL_OVERFLOW.set(max(pool.overflow() - closing_overflow, 0))
+
+# 쿼리 수와 실행 시간 (라벨은 SELECT/INSERT 같은 첫 키워드만 사용)
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+# 시작 시각은 실행 컨텍스트에 저장 (실패한 쿼리가 커넥션에 값을 남기지 않도록)
+@event.listens_for(postgres_engine.sync_engine, "before_cursor_execute")
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+@event.listens_for(postgres_engine.sync_engine, "after_cursor_execute")
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    keyword = statement.split(None, 1)[0].upper() if statement.strip() else ""
+    operation = keyword if keyword in SQL_OPERATIONS else "OTHER"
+    DB_QUERIES.labels(operation).inc()
+    DB_QUERY_DURATION.labels(operation).observe(elapsed)
+
+    stats = current_query_stats()
+    if stats:
+        stats.count += 1
+        stats.duration += elapsed
+
+    # 슬로우 쿼리는 파라미터 값을 빼고 SQL만 기록 (개인정보, 비밀번호 해시 노출 방지)
+    elapsed_ms = elapsed * 1000
+    if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+        sql = " ".join(statement.split())
+        rows = f" x{len(parameters)}" if executemany else ""
+        loggers["slow_query"].warning(
+            f"{stats.path if stats else '-'} [{round(elapsed_ms, 1)}ms] {sql} (파라미터 생략{rows})"
+        )
 
 # PostgreSQL 비동기식 DB 세션 관리
 async def get_postgres_db():
     async with AsyncSessionLocal() as session:
         yield session
 
-# Redis 연결
+# 커넥션 사용 현황 기록용 Redis 풀 (최대 개수에 도달하면 pool_timeout까지 대기)
+class InstrumentedRedisPool(aioredis.BlockingConnectionPool):
+    async def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)
+        REDIS_POOL_WAIT.observe(time.perf_counter() - start)
+        REDIS_POOL_IN_USE.inc()
+        return connection
+
+    async def release(self, connection):
+        await super().release(connection)
+        REDIS_POOL_IN_USE.dec()
+
+# 명령별 처리 시간 기록 (파이프라인은 한 번에 전송되므로 제외)
+class InstrumentedRedis(aioredis.Redis):
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_LATENCY.labels(str(args[0]).upper()).observe(time.perf_counter() - start)
+
+# Redis 연결 - 세션, 소셜 로그인 state, 캐시가 모두 같은 커넥션 풀 사용
 class RedisClient:
-    _redis = None
+    _pool: InstrumentedRedisPool | None = None
+    _redis: InstrumentedRedis | None = None
 
     @classmethod
-    async def get_redis(cls):
+    async def get_redis(cls) -> aioredis.Redis:
         if cls._redis is None:
-            cls._redis = await aioredis.from_url(f"redis://{settings.REDIS_HOST}", decode_responses=True)
+            cls._pool = InstrumentedRedisPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                decode_responses=True,
+            )
+            cls._redis = InstrumentedRedis(connection_pool=cls._pool)
         return cls._redis
 
     @classmethod
     async def close_redis(cls):
         if cls._redis:
-            await cls._redis.close()
+            await cls._redis.aclose()
+            await cls._pool.disconnect()
             cls._redis = None
+            cls._pool = None
+
+# Ollama(LLM) 연결 - 앱 전체에서 커넥션 풀 공유 (요청마다 TCP 연결 새로 맺지 않기 위함)
+class OllamaClient:
+    _client: httpx.AsyncClient | None = None
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.OLLAMA_TIMEOUT, connect=settings.OLLAMA_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=settings.OLLAMA_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.OLLAMA_KEEPALIVE_EXPIRY,
+                ),
+                # HTTP/2는 h2 패키지가 있을 때만 사용 (평문 http에서는 HTTP/1.1 keep-alive로 동작)
+                http2=settings.OLLAMA_HTTP2 and find_spec("h2") is not None,
+            )
+        return cls._client
+
+    @classmethod
+    async def close_client(cls):
+        if cls._client:
+            await cls._client.aclose()
+            cls._client = None
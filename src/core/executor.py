@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from core.config import settings
+from core.metrics import PASSWORD_POOL_WAIT, PASSWORD_POOL_PENDING
+
+# bcrypt 같은 CPU 작업을 이벤트 루프 밖의 전용 스레드 풀에서 실행
+# (bcrypt는 해싱 중 GIL을 놓기 때문에 스레드로도 다른 요청이 막히지 않음)
+
+class PasswordHashPool:
+    _executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_POOL_SIZE,
+                thread_name_prefix="bcrypt"
+            )
+        return cls._executor
+
+    @classmethod
+    async def run(cls, func, *args):
+        submitted_at = time.perf_counter()
+        PASSWORD_POOL_PENDING.inc()
+
+        def task():
+            # 스레드가 작업을 집어가기까지 기다린 시간 기록
+            PASSWORD_POOL_WAIT.observe(time.perf_counter() - submitted_at)
+            PASSWORD_POOL_PENDING.dec()
+            return func(*args)
+
+        future = cls.get_executor().submit(task)
+        # 요청이 취소(클라이언트 연결 끊김 등)되어 시작 전에 작업이 취소되면 task가 실행되지 않으므로 여기서 감소
+        future.add_done_callback(lambda f: f.cancelled() and PASSWORD_POOL_PENDING.dec())
+        return await asyncio.wrap_future(future)
+
+    @classmethod
+    def shutdown(cls):
+        if cls._executor:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
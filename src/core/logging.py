@@ -1,5 +1,7 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import os
 import sys
 from datetime import datetime, timedelta, timezone
@@ -11,8 +13,8 @@ KST = timezone(timedelta(hours=9))
 def kst_converter(*args):
     return datetime.now(tz=KST).timetuple()
 
-# 로그 디렉토리 생성
-LOG_DIR = "/app/logs"
+# 로그 디렉토리 생성 (벤치마크 등 로컬 실행 시 LOG_DIR 환경 변수로 변경 가능)
+LOG_DIR = os.environ.get("LOG_DIR", "/app/logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 
 # 포매터 설정
@@ -29,7 +31,8 @@ LOG_FILES = {
     "business": "business.log",
     "access": "access.log",
     "security": "security.log",
-    "background": "background.log"
+    "background": "background.log",
+    "slow_query": "slow_query.log"
 }
 
 def create_file_handler(name: str, level=logging.INFO):
@@ -42,26 +45,52 @@ def create_file_handler(name: str, level=logging.INFO):
     handler.setLevel(level)
     return handler
 
+# 파일 쓰기/로테이션은 별도 스레드(QueueListener)에서 처리 -> 이벤트 루프에서는 큐에 넣기만 함
+log_queue = queue.SimpleQueue()
+log_listener: QueueListener | None = None
+
 def setup_logging():
+    global log_listener
+
     # 각 카테고리별 전용 로거 설정
     loggers = {}
+    handlers = []
 
     for name in LOG_FILES:
         logger = logging.getLogger(f"capstone.{name}")
         logger.setLevel(logging.INFO)
         logger.handlers = []
-        logger.addHandler(create_file_handler(name))
+        logger.addHandler(QueueHandler(log_queue))
 
-        # 콘솔 출력
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        console_handler.setLevel(logging.WARNING)
-        logger.addHandler(console_handler)
+        # 카테고리별 파일에는 해당 로거의 로그만 기록
+        file_handler = create_file_handler(name)
+        file_handler.addFilter(logging.Filter(logger.name))
+        handlers.append(file_handler)
 
         loggers[name] = logger
 
+    # 콘솔 출력
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    console_handler.setLevel(logging.WARNING)
+    handlers.append(console_handler)
+
+    if log_listener:
+        log_listener.stop()
+    log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+
     return loggers
 
+# 종료 시 큐에 남은 로그까지 기록
+def stop_logging():
+    global log_listener
+    if log_listener:
+        log_listener.stop()
+        log_listener = None
+
+atexit.register(stop_logging)
+
 # 비즈니스 로그 추적
 def service_log(service: str, message: str, user_id: int | None = None, level: str = "INFO"):
     tag = f"[{service}]"
@@ -102,3 +131,4 @@ loggers["business"].info("비즈니스 로그 활성")
 loggers["access"].info("접근 로그 활성")
 loggers["security"].warning("보안 관련 로그 활성")
 loggers["background"].info("스케줄러 로그 활성")
+loggers["slow_query"].info("슬로우 쿼리 로그 활성")
@@ -0,0 +1,176 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess
+)
+
+# 성능 지표 (Prometheus)
+# Gauge는 uvicorn 멀티 워커 환경에서도 합산되도록 multiprocess_mode 지정
+# 멀티 워커로 실행할 때는 PROMETHEUS_MULTIPROC_DIR 환경 변수를 지정해야 워커별 값이 합쳐짐
+
+# ------------------- LLM 대기열 -------------------
+LLM_INFLIGHT = Gauge(
+    "llm_inflight_requests",
+    "Ollama에 전달되어 처리 중인 요청 수",
+    multiprocess_mode="livesum"
+)
+LLM_QUEUE_DEPTH = Gauge(
+    "llm_queue_depth",
+    "Ollama 처리 슬롯을 기다리는 요청 수",
+    multiprocess_mode="livesum"
+)
+LLM_QUEUE_WAIT = Histogram(
+    "llm_queue_wait_seconds",
+    "Ollama 처리 슬롯을 얻기까지 기다린 시간",
+    buckets=(0.005, 0.05, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+)
+LLM_REJECTED = Counter(
+    "llm_rejected_total",
+    "대기열 초과 또는 대기 시간 초과로 거절된 LLM 요청 수",
+    ["reason"]
+)
+
+# ------------------- 비밀번호 해시 스레드 풀 -------------------
+PASSWORD_POOL_WAIT = Histogram(
+    "password_hash_pool_wait_seconds",
+    "bcrypt 작업이 스레드 풀에서 실행되기까지 기다린 시간",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+PASSWORD_POOL_PENDING = Gauge(
+    "password_hash_pool_pending",
+    "스레드 풀에서 실행을 기다리는 bcrypt 작업 수",
+    multiprocess_mode="livesum"
+)
+
+# ------------------- PostgreSQL 커넥션 풀 -------------------
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 커넥션을 얻기까지 기다린 시간",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30)
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "사용 중인 DB 커넥션 수",
+    multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "pool_size를 넘어 추가로 열린 DB 커넥션 수",
+    multiprocess_mode="livesum"
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 안에 커넥션을 얻지 못한 횟수"
+)
+
+# ------------------- Redis 커넥션 풀 -------------------
+REDIS_POOL_WAIT = Histogram(
+    "redis_pool_checkout_wait_seconds",
+    "Redis 커넥션 풀에서 커넥션을 얻기까지 기다린 시간",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+)
+REDIS_POOL_IN_USE = Gauge(
+    "redis_pool_connections_in_use",
+    "사용 중인 Redis 커넥션 수",
+    multiprocess_mode="livesum"
+)
+
+# ------------------- HTTP 요청 -------------------
+# route는 실제 경로가 아닌 라우트 템플릿 (/ingredients/{ingredient_name})
+HTTP_REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "라우트별 요청 처리 시간",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+HTTP_RESPONSES = Counter(
+    "http_responses_total",
+    "라우트별 응답 상태 코드 수",
+    ["method", "route", "status"]
+)
+HTTP_INFLIGHT = Gauge(
+    "http_inflight_requests",
+    "처리 중인 HTTP 요청 수",
+    multiprocess_mode="livesum"
+)
+
+# ------------------- DB 쿼리 -------------------
+DB_QUERIES = Counter(
+    "db_queries_total",
+    "실행한 SQL 쿼리 수",
+    ["operation"]
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL 쿼리 실행 시간",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+)
+
+# ------------------- Redis 명령 -------------------
+REDIS_COMMAND_LATENCY = Histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 처리 시간",
+    ["command"],
+    buckets=(0.0002, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1, 0.5, 1)
+)
+
+# ------------------- Ollama 생성 -------------------
+OLLAMA_GENERATION_LATENCY = Histogram(
+    "ollama_generation_duration_seconds",
+    "Ollama 응답 생성 시간 (대기열 대기 시간 제외)",
+    ["mode"],
+    buckets=(0.5, 1, 2.5, 5, 10, 15, 20, 30, 45, 60, 90, 120)
+)
+OLLAMA_TOKENS = Counter(
+    "ollama_tokens_total",
+    "Ollama가 처리한 토큰 수 (prompt: 입력, completion: 생성)",
+    ["type"]
+)
+
+# ------------------- Ollama 노드 분산 -------------------
+OLLAMA_BACKEND_INFLIGHT = Gauge(
+    "ollama_backend_inflight_requests",
+    "Ollama 노드별 처리 중인 요청 수",
+    ["backend"],
+    multiprocess_mode="livesum"
+)
+OLLAMA_BACKEND_EJECTIONS = Counter(
+    "ollama_backend_ejections_total",
+    "연속 실패로 Ollama 노드가 제외된 횟수",
+    ["backend"]
+)
+
+# ------------------- 비동기 레시피 작업 -------------------
+RECIPE_JOBS = Counter(
+    "recipe_jobs_total",
+    "비동기 레시피 작업 수 (queued: 대기열 추가, cached: 캐시로 바로 완료, done/failed: 처리 결과)",
+    ["status"]
+)
+RECIPE_JOB_WAIT = Histogram(
+    "recipe_job_wait_seconds",
+    "비동기 레시피 작업이 대기열에서 처리되기 시작할 때까지 기다린 시간",
+    buckets=(0.05, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+)
+
+# /metrics 응답 본문 생성 (멀티 워커면 워커별 값을 합산)
+def render_metrics() -> tuple[bytes, str]:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+# 워커 종료 시 해당 워커의 livesum Gauge 값 정리
+def mark_process_dead():
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,30 @@
+from contextvars import ContextVar
+
+# 요청 단위 DB 쿼리 통계 (쿼리 수, DB 시간)
+# 미들웨어에서 요청마다 새로 만들고, SQLAlchemy 이벤트 훅에서 누적
+
+class QueryStats:
+    __slots__ = ("path", "count", "duration")
+
+    def __init__(self, path: str = "-"):
+        self.path = path
+        self.count = 0
+        self.duration = 0.0
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 1)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+def start_query_stats(path: str):
+    stats = QueryStats(path)
+    return stats, _current.set(stats)
+
+def reset_query_stats(token):
+    _current.reset(token)
+
+# 요청 밖(백그라운드 작업 등)에서 실행된 쿼리는 None
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
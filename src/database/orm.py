@@ -1,10 +1,7 @@
-from typing import Optional
-from datetime import datetime
-
-from sqlalchemy import Column, BigInteger, String, ForeignKey, Date, Enum, TIMESTAMP, text, Integer, Boolean
+from sqlalchemy import Column, BigInteger, String, ForeignKey, Date, Enum, TIMESTAMP, text, Integer, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import declarative_base, relationship
 
-from schema.request import IngredientRequest, IngredientCategoriesRequest
+from schema.request import IngredientCategoriesRequest
 
 #ORM은 객체(Object)와 데이터베이스(Table)을 연결(Mapping)하는 기술
 #SQL을 직접 쓰지 않고 파이썬 언어로 데이터베이스 조작하게 하는 도구
@@ -45,6 +42,10 @@ class User(Base):
 # 식재료 관련 테이블
 class Ingredient(Base):
     __tablename__ = "ingredients"
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_ingredients_user_id_name"),   # 유저별 재료 이름 중복 방지 (user_id 조회에도 사용)
+        Index("ix_ingredients_user_id_expiration_date", "user_id", "expiration_date"),   # 유통기한 임박 순 조회
+    )
 
     id = Column(BigInteger, primary_key=True, index=True)
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)   #외래키 참조
@@ -52,16 +53,6 @@ class Ingredient(Base):
     expiration_date = Column(Date, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("CURRENT_TIMESTAMP"), nullable=False)
 
-    @classmethod
-    def create(cls, request: IngredientRequest, user_id: int, expiration_date: Optional[datetime] = None):
-        expiration_date = expiration_date or request.expiration_date  # 자동 기입 또는 수동 기입
-
-        return cls(
-            user_id=user_id,
-            name=request.name,
-            expiration_date=expiration_date
-        )
-
     #릴레이션 정의
     user = relationship("User", back_populates="ingredients")
 
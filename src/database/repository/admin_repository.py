@@ -4,6 +4,7 @@ from database.orm import IngredientCategories
 from exception.admin_exception import CategoryNotFoundException
 from schema.request import IngredientCategoriesRequest
 from utils.base_repository import commit_with_error_handling
+from cache.category_cache import CategoryCache
 
 #관리자 권한 리포지토리
 
@@ -27,6 +28,7 @@ class AdminRepository:
         )
         self.session.add(new_category)
         await commit_with_error_handling(self.session, context="카테고리 생성")
+        await CategoryCache.publish_invalidation()
         await self.session.refresh(new_category)
         return new_category
 
@@ -43,6 +45,7 @@ class AdminRepository:
 
         await self.session.delete(category)
         await commit_with_error_handling(self.session, context=f"{ingredient_name} 카테고리 삭제")
+        await CategoryCache.publish_invalidation()
         return True
 
     async def update_category_expiration(self, ingredient_name: str, new_expiration: int) -> bool:
@@ -52,5 +55,6 @@ class AdminRepository:
 
         category.default_expiration_days = new_expiration
         await commit_with_error_handling(self.session, context=f"[{ingredient_name}] 카테고리 유통기한 수정")
+        await CategoryCache.publish_invalidation()
         await self.session.refresh(category)
         return True
\ No newline at end of file
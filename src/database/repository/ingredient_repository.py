@@ -1,7 +1,9 @@
-from typing import Optional, List
-from sqlalchemy import select, delete, and_
+from typing import Optional, List, Dict
+from sqlalchemy import select, delete, and_, or_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timedelta
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime, timedelta, date
 
 from exception.external_exception import UnexpectedException
 
@@ -13,66 +15,119 @@ from database.orm import (
     Ingredient,
     ManualExpirationLog,
     UnrecognizedIngredientLog,
-    IngredientCategories
 )
 
 from exception.database_exception import (
     DatabaseException)
 
 from utils.base_repository import commit_with_error_handling
+from cache.ingredient_cache import IngredientCache
+from cache.category_cache import CategoryCache
 # 식재료 관련 리포지토리
 
 class IngredientRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create_ingredient(self, ingredient):
-        self.session.add(ingredient)
-        await commit_with_error_handling(self.session, context="식재료 생성")
+    # 여러 식재료의 기본 유통기한을 한 번에 조회 (이름 -> 자동 기입될 유통기한)
+    async def get_default_expirations(self, ingredient_names: List[str]) -> Dict[str, date]:
+        if not ingredient_names:
+            return {}
 
-    # 유통기한 카테고리 에서 유통기한 부여
-    async def get_default_expiration(self, ingredient_name: str) -> Optional[int]:
-        stmt = select(IngredientCategories.default_expiration_days).where(
-            IngredientCategories.ingredient_name == ingredient_name
-        )
-        result = await self.session.execute(stmt)
-        days = result.scalar()
-        if days is not None:
-            return (datetime.utcnow() + timedelta(days=days)).date()
-        return None
-
-    # 유저가 수동적으로 입력한 유통기한 로그 관련 (유통기한 편차 확인용)
-    async def save_manual_expiration_log(self, user_id: int, ingredient_name: str, expiration_date: int, event_type: str):
-        log = ManualExpirationLog(
-            user_id=user_id,
-            ingredient_name=ingredient_name,
-            expiration_date=expiration_date,
-            event_type=event_type
-        )
-        self.session.add(log)
-        await commit_with_error_handling(self.session, context="수동 유통기한 로그 저장")
-
-    # 유저가 유통기한 부여하지 않고, 우리 DB에도 해당 식재료에 대한 유통기한 없을 때 확인하는 로그 (업데이트용)
-    async def save_unrecognized_ingredient_log(self, user_id: int, ingredient_name: str):
-        log = UnrecognizedIngredientLog(
-            user_id=user_id,
-            ingredient_name=ingredient_name
-        )
-        self.session.add(log)
-        await commit_with_error_handling(self.session, context="유통기한 미인식 로그 저장")
+        expirations = await CategoryCache.get_expirations()
 
-    async def get_ingredient_by_name(self, user_id: int, name: str) -> Optional[Ingredient]:
-        stmt = select(Ingredient).filter(
-            Ingredient.user_id == user_id,
-            Ingredient.name == name)
-        result = await self.session.execute(stmt)
-        return result.scalar()  # 첫 번째 결과 반환
+        today = datetime.utcnow()
+        return {
+            name: (today + timedelta(days=expirations[name])).date()
+            for name in ingredient_names if name in expirations
+        }
+
+    # ON CONFLICT를 지원하는 방언별 INSERT (운영은 PostgreSQL, 로컬 벤치마크는 SQLite)
+    def _insert_on_conflict(self, table):
+        if self.session.bind.dialect.name == "sqlite":
+            return sqlite_insert(table)
+        return postgresql_insert(table)
+
+    # 식재료와 유통기한 로그를 multi-row INSERT로 저장하고 한 번만 커밋
+    # 이미 있는 재료((user_id, name) 유니크 제약)는 INSERT ... ON CONFLICT DO NOTHING으로 건너뛰고 추가된 행만 반환
+    async def bulk_create_ingredients(
+        self,
+        user_id: int,
+        ingredients: List[dict],
+        manual_logs: List[dict],
+        unrecognized_logs: List[dict]
+    ):
+        if not ingredients:
+            return []
 
-    async def get_ingredients(self, user_id: int) -> List[Ingredient]:
         try:
-            stmt = select(Ingredient).filter(Ingredient.user_id == user_id)
+            # ORM bulk insert는 None 값 유무에 따라 INSERT를 나누므로 테이블 단위 INSERT 사용
+            table = Ingredient.__table__
+            stmt = (
+                self._insert_on_conflict(table)
+                .on_conflict_do_nothing(index_elements=["user_id", "name"])
+                .returning(*table.c)
+            )
+            result = await self.session.execute(stmt, ingredients)
+            created_by_name = {row.name: row for row in result.all()}
+
+            # 로그는 실제로 추가된 재료만 기록
+            manual_logs = [log for log in manual_logs if log["ingredient_name"] in created_by_name]
+            unrecognized_logs = [log for log in unrecognized_logs if log["ingredient_name"] in created_by_name]
+            if manual_logs:
+                await self.session.execute(insert(ManualExpirationLog), manual_logs)
+            if unrecognized_logs:
+                await self.session.execute(insert(UnrecognizedIngredientLog), unrecognized_logs)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(detail=f"식재료 일괄 생성 중 DB 오류: {str(e)}")
+
+        await commit_with_error_handling(self.session, context="식재료 일괄 생성")
+        if created_by_name:
+            await IngredientCache.invalidate(user_id)
+
+        # RETURNING 순서는 보장되지 않으므로 요청 순서대로 정렬
+        return [created_by_name[row["name"]] for row in ingredients if row["name"] in created_by_name]
+
+    # 키셋 페이지네이션: after는 이전 페이지 마지막 행의 (유통기한, id)
+    # sort="expiry"면 유통기한 임박 순 (유통기한 없는 재료는 마지막), 아니면 등록 순
+    async def get_ingredients(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        after: Optional[tuple] = None,
+        sort: str = "created"
+    ):
+        try:
+            stmt = select(
+                Ingredient.id,
+                Ingredient.user_id,
+                Ingredient.name,
+                Ingredient.expiration_date
+            ).filter(Ingredient.user_id == user_id)
+
+            if sort == "expiry":
+                stmt = stmt.order_by(Ingredient.expiration_date.asc().nulls_last(), Ingredient.id.asc())
+                if after:
+                    after_date, after_id = after
+                    if after_date is None:
+                        stmt = stmt.filter(Ingredient.expiration_date.is_(None), Ingredient.id > after_id)
+                    else:
+                        stmt = stmt.filter(or_(
+                            Ingredient.expiration_date > after_date,
+                            and_(Ingredient.expiration_date == after_date, Ingredient.id > after_id),
+                            Ingredient.expiration_date.is_(None)
+                        ))
+            else:
+                stmt = stmt.order_by(Ingredient.id.asc())
+                if after:
+                    stmt = stmt.filter(Ingredient.id > after[1])
+
+            if limit:
+                stmt = stmt.limit(limit)
+
             result = await self.session.execute(stmt)
-            return result.scalars().all()
+            return result.all()
         except SQLAlchemyError as e:
             raise DatabaseException(detail=f"재료 조회 중 DB 오류: {str(e)}")
         except Exception as e:
@@ -84,4 +139,8 @@ class IngredientRepository:
         )
         result = await self.session.execute(stmt)
         await commit_with_error_handling(self.session, context="식재료 삭제")
-        return result.rowcount > 0
\ No newline at end of file
+
+        if result.rowcount > 0:
+            await IngredientCache.invalidate(user_id)
+            return True
+        return False
\ No newline at end of file
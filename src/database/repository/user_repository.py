@@ -14,6 +14,7 @@ from utils.base_repository import commit_with_error_handling
 
 from exception.external_exception import UnexpectedException
 from database.orm import User
+from cache.user_cache import UserCache
 
 # 유저 관련 리프지토리
 
@@ -50,4 +51,5 @@ class UserRepository:
     async def update_password(self, user: User, hashed_password: str) -> None:
         user.password = hashed_password
         self.session.add(user)
-        await commit_with_error_handling(self.session, context="비밀번호 변경")
\ No newline at end of file
+        await commit_with_error_handling(self.session, context="비밀번호 변경")
+        await UserCache.invalidate(user.email)
\ No newline at end of file
@@ -10,6 +10,7 @@ from service.auth.social.google import GoogleAuthService
 from service.user_service import UserService
 from service.ingredient_service import IngredientService
 from service.recipe.foodthing import CookAIService
+from service.recipe.recipe_jobs import RecipeJobService
 from service.auth.social.naver import NaverAuthService
 from service.auth.jwt_handler import get_access_token
 
@@ -55,6 +56,14 @@ def get_cook_ai_service(
 ) -> CookAIService:
     return CookAIService(user_service, user_repo, access_token, req)
 
+def get_recipe_job_service(
+    req: Request,
+    access_token: str = Depends(get_access_token),
+    user_service: UserService = Depends(get_user_service),
+    user_repo: UserRepository = Depends(get_user_repo),
+) -> RecipeJobService:
+    return RecipeJobService(user_service, user_repo, access_token, req)
+
 def get_naver_auth_service(
     user_service: UserService = Depends(get_user_service),
     user_repo: UserRepository = Depends(get_user_repo),
@@ -1,10 +1,11 @@
 class CustomException(Exception):
     log_level: str = "WARNING"  # 기본 로그 레벨
 
-    def __init__(self, status_code: int = 400, detail: str = "에러가 발생했습니다", code: str = "ERROR"):
+    def __init__(self, status_code: int = 400, detail: str = "에러가 발생했습니다", code: str = "ERROR", headers: dict | None = None):
         self.status_code = status_code
         self.detail = detail
         self.code = code
+        self.headers = headers
 
     def log(self, logger, request_url: str = ""):
         message = f"[{self.__class__.__name__}] {self.code} - {self.detail}"
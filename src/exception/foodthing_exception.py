@@ -18,4 +18,19 @@ class AIJsonDecodeException(CustomException):
 class InvalidAIRequestException(CustomException):
     log_level = "WARNING"
     def __init__(self, detail="요청 데이터가 유효하지 않습니다"):
-        super().__init__(status_code=400, detail=detail, code="INVALID_AI_REQUEST")
\ No newline at end of file
+        super().__init__(status_code=400, detail=detail, code="INVALID_AI_REQUEST")
+class AIServiceUnavailableException(CustomException):
+    log_level = "WARNING"
+    def __init__(self, detail="AI 서버가 현재 응답하지 않습니다. 잠시 후 다시 시도해주세요", retry_after: int | None = None):
+        headers = {"Retry-After": str(retry_after)} if retry_after else None
+        super().__init__(status_code=503, detail=detail, code="AI_SERVICE_UNAVAILABLE", headers=headers)
+
+class AIServiceBusyException(CustomException):
+    log_level = "WARNING"
+    def __init__(self, detail="AI 요청 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요", retry_after: int = 5):
+        super().__init__(status_code=429, detail=detail, code="AI_SERVICE_BUSY", headers={"Retry-After": str(retry_after)})
+
+class RecipeJobNotFoundException(CustomException):
+    log_level = "INFO"
+    def __init__(self, detail="레시피 작업을 찾을 수 없습니다. 만료되었거나 존재하지 않는 작업입니다"):
+        super().__init__(status_code=404, detail=detail, code="RECIPE_JOB_NOT_FOUND")
@@ -6,4 +6,8 @@ class IngredientConflictException(CustomException):
 
 class IngredientNotFoundException(CustomException):
     def __init__(self, detail="해당 재료가 존재하지 않아 삭제할 수 없습니다"):
-        super().__init__(status_code=404, detail=detail, code="INGREDIENT_NOT_FOUND")
\ No newline at end of file
+        super().__init__(status_code=404, detail=detail, code="INGREDIENT_NOT_FOUND")
+
+class InvalidCursorException(CustomException):
+    def __init__(self, detail="잘못된 페이지 커서입니다"):
+        super().__init__(status_code=400, detail=detail, code="INVALID_CURSOR")
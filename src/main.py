@@ -1,13 +1,21 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from contextlib import asynccontextmanager
 
 from api import user, ingredient, recipe, admin
 from core.config import settings
-from core.connection import AsyncSessionLocal, RedisClient
+from core.connection import AsyncSessionLocal, RedisClient, OllamaClient
+from core.executor import PasswordHashPool
 from core.logging import loggers
+from core.metrics import mark_process_dead, render_metrics
+from service.recipe.ollama_monitor import OllamaHealthMonitor
+from service.recipe.ollama_warmup import OllamaWarmer
+from service.recipe.recipe_jobs import RecipeJobQueue
+from cache.category_cache import CategoryCache
+from cache.invalidation import InvalidationBus
 from middlewares.access_logging import AccessLogMiddleware
+from middlewares.metrics import MetricsMiddleware
 from middlewares.session import RedisSessionMiddleware
 from exception.handler import (
     custom_exception_handler,
@@ -32,6 +40,14 @@ async def lifespan(app: FastAPI):
         if len(secret_key_value) != 64:
             raise ValueError("SECRET_KEY는 반드시 64자리여야 합니다.")
 
+        # 동일 요청을 기다리는 시간은 생성 한 번의 최대 시간(대기열 대기 + Ollama 호출)보다 길어야 함
+        # (모델 로드 확인 전에는 Ollama 호출이 OLLAMA_WARMUP_TIMEOUT까지 걸릴 수 있음)
+        max_call_timeout = max(settings.OLLAMA_TIMEOUT, settings.OLLAMA_WARMUP_TIMEOUT)
+        if settings.SINGLE_FLIGHT_WAIT_TIMEOUT <= settings.LLM_QUEUE_TIMEOUT + max_call_timeout:
+            raise ValueError(
+                "SINGLE_FLIGHT_WAIT_TIMEOUT은 LLM_QUEUE_TIMEOUT + max(OLLAMA_TIMEOUT, OLLAMA_WARMUP_TIMEOUT)보다 커야 합니다."
+            )
+
     except Exception as e:
         system_logger.error(f".env 설정 오류: {e}", exc_info=True)
         raise RuntimeError("앱 실행 중단 🔴")
@@ -44,18 +60,41 @@ async def lifespan(app: FastAPI):
         raise RuntimeError("PostgreSQL 연결 실패 🔴")
 
     try:
+        # Redis 커넥션 풀 생성 (세션, 소셜 로그인, 캐시 공용)
         redis = await RedisClient.get_redis()
         await redis.ping()
     except Exception as e:
         system_logger.error(f"Redis 연결 실패: {e}")
         raise RuntimeError("Redis 연결 실패 🔴")
 
+    # 유통기한 카테고리 캐시 로드 + 워커 간 캐시 무효화 채널 구독
+    await CategoryCache.start()
+    await InvalidationBus.start()
+
+    # Ollama 커넥션 풀 생성 (앱 종료 시까지 재사용) + 백그라운드 헬스체크 시작
+    OllamaClient.get_client()
+    await OllamaHealthMonitor.start()
+
+    # 모델 미리 로드 (백그라운드, 시작을 기다리게 하지 않음) + 영업 시간 keep-alive
+    await OllamaWarmer.start()
+
+    # 비동기 레시피 작업 처리 태스크 시작
+    await RecipeJobQueue.start()
+
     system_logger.info("FastAPI 애플리케이션 정상 작동")
     yield
 
 
+    await RecipeJobQueue.stop()
+    await InvalidationBus.stop()
+    await OllamaWarmer.stop()
+    await OllamaHealthMonitor.stop()
+    await OllamaClient.close_client()
+    system_logger.info("Ollama 연결 종료")
     await RedisClient.close_redis()
     system_logger.info("Redis 연결 종료")
+    PasswordHashPool.shutdown()
+    mark_process_dead()
     system_logger.info("FastAPI 애플리케이션 종료")
 app = FastAPI(lifespan=lifespan)
 
@@ -87,6 +126,9 @@ app.add_middleware(
 # 외부에서 접속시 로그 기록
 app.add_middleware(AccessLogMiddleware)
 
+# 라우트별 성능 지표 기록
+app.add_middleware(MetricsMiddleware)
+
 # router 리스트
 app.include_router(user.router)
 app.include_router(ingredient.router)
@@ -95,4 +137,10 @@ app.include_router(admin.router)
 
 @app.get("/")
 def hello_world():
-    return {"Hello":"World!"}
\ No newline at end of file
+    return {"Hello":"World!"}
+
+# Prometheus 성능 지표
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    data, content_type = render_metrics()
+    return Response(content=data, media_type=content_type)
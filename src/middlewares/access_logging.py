@@ -1,20 +1,44 @@
 #백엔드 서버에 접근한 IP 로그
+# 순수 ASGI 미들웨어: 응답 상태 코드와 처리 시간은 send 메시지에서 확인
+# 요청마다 DB 쿼리 수와 DB 시간을 함께 기록 (설정 시 Server-Timing 헤더로도 전달)
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from time import time
+from time import perf_counter
+from starlette.datastructures import MutableHeaders
+from core.config import settings
 from core.logging import loggers
+from core.query_stats import start_query_stats, reset_query_stats
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time()
-        response: Response = await call_next(request)
-        duration = round(time() - start_time, 4)
+class AccessLogMiddleware:
+    def __init__(self, app):
+        self.app = app
 
-        loggers["access"].info(
-            f"{request.client.host} {request.method} {request.url.path} "
-            f"-> {response.status_code} [{duration}s]"
-        )
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        start_time = perf_counter()
+        status_code = 500  # 응답 시작 전에 예외로 끝나면 500으로 기록
+        stats, token = start_query_stats(scope["path"])
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", f'db;dur={stats.duration_ms};desc="{stats.count} queries"')
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_query_stats(token)
+            duration = round(perf_counter() - start_time, 4)
+            client = scope.get("client")
+            host = client[0] if client else "-"
+
+            loggers["access"].info(
+                f"{host} {scope['method']} {scope['path']} "
+                f"-> {status_code} [{duration}s] [db {stats.count}q {stats.duration_ms}ms]"
+            )
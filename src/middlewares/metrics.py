@@ -0,0 +1,36 @@
+#라우트별 요청 처리 시간, 상태 코드, 처리 중인 요청 수 기록
+# 순수 ASGI 미들웨어: 라우트 템플릿은 라우팅이 끝난 뒤 scope["route"]에서 확인
+
+from time import perf_counter
+from core.metrics import HTTP_INFLIGHT, HTTP_REQUEST_LATENCY, HTTP_RESPONSES
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = perf_counter()
+        status_code = 500  # 응답 시작 전에 예외로 끝나면 500으로 기록
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_INFLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_INFLIGHT.dec()
+            # 매칭되는 라우트가 없으면 실제 경로 대신 고정값 사용 (라벨 개수 제한)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+
+            HTTP_REQUEST_LATENCY.labels(method, route_path).observe(perf_counter() - start_time)
+            HTTP_RESPONSES.labels(method, route_path, str(status_code)).inc()
@@ -1,46 +1,119 @@
 # Redis(비동기 세션 관련 미들웨어)
+# 순수 ASGI 미들웨어: 핸들러가 세션을 처음 사용할 때만 Redis에서 읽고, 바뀐 경우에만 저장
 
 import json
-import redis.asyncio as aioredis
+import secrets
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from itsdangerous import Signer
+from http.cookies import SimpleCookie
+from itsdangerous import Signer, BadSignature
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection, Request
 
-from core.config import settings
+from core.connection import RedisClient
 
-# Redis 연결
-REDIS_URL = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}"
-redis = None
+SESSION_KEY_PREFIX = "session:"
 
-async def get_redis():
-    global redis
-    if redis is None:
-        redis = await aioredis.from_url(REDIS_URL)
-    return redis
+class LazySession:
+    def __init__(self, session_id: str | None):
+        self.session_id = session_id
+        self._data: dict | None = None
+        self._snapshot: str | None = None
 
-class RedisSessionMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, secret_key: str, session_cookie: str = "session_id"):
-        super().__init__(app)
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def empty(self) -> bool:
+        return not self._data
+
+    @property
+    def modified(self) -> bool:
+        return self.loaded and self._dump() != self._snapshot
+
+    # 처음 접근할 때만 Redis 조회
+    async def load(self) -> dict:
+        if self._data is None:
+            data = None
+            if self.session_id:
+                redis = await RedisClient.get_redis()
+                data = await redis.get(f"{SESSION_KEY_PREFIX}{self.session_id}")
+            self._data = json.loads(data) if data else {}
+            self._snapshot = self._dump()
+        return self._data
+
+    def _dump(self) -> str:
+        return json.dumps(self._data, sort_keys=True, ensure_ascii=False)
+
+    # 변경된 경우 저장, 읽기만 한 경우 만료 시간만 연장
+    async def save(self, max_age: int) -> bool:
+        """쿠키를 새로 내려줘야 하면 True"""
+        redis = await RedisClient.get_redis()
+
+        if self.modified:
+            if not self._data:
+                if self.session_id:
+                    await redis.delete(f"{SESSION_KEY_PREFIX}{self.session_id}")
+                return True
+
+            if not self.session_id:
+                self.session_id = secrets.token_urlsafe(32)
+            await redis.set(f"{SESSION_KEY_PREFIX}{self.session_id}", self._dump(), ex=max_age)
+            return True
+
+        if self._data and self.session_id:
+            await redis.expire(f"{SESSION_KEY_PREFIX}{self.session_id}", max_age)
+        return False
+
+
+class RedisSessionMiddleware:
+    def __init__(self, app, secret_key: str, session_cookie: str = "session_id", max_age: int = 3600):
+        self.app = app
         self.signer = Signer(secret_key)
         self.session_cookie = session_cookie
+        self.max_age = max_age
 
-    async def dispatch(self, request: Request, call_next):
-        redis = await get_redis()
-        session_id = request.cookies.get(self.session_cookie)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
 
-        if session_id:
-            session_id = self.signer.unsign(session_id).decode()
-            session_data = await redis.get(f"session:{session_id}")
-            request.state.session = json.loads(session_data) if session_data else {}
-        else:
-            request.state.session = {}
+        session = LazySession(self._unsign(HTTPConnection(scope).cookies.get(self.session_cookie)))
+        scope.setdefault("state", {})["session"] = session  # request.state.session
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and session.loaded:
+                if await session.save(self.max_age):
+                    headers = MutableHeaders(scope=message)
+                    headers.append("set-cookie", self._cookie_header(session))
+            await send(message)
 
-        response = await call_next(request)
+        await self.app(scope, receive, send_wrapper)
+
+    def _unsign(self, signed_id: str | None) -> str | None:
+        if not signed_id:
+            return None
+        try:
+            return self.signer.unsign(signed_id).decode()
+        except BadSignature:
+            return None
+
+    def _cookie_header(self, session: LazySession) -> str:
+        cookie = SimpleCookie()
+        if session.session_id and not session.empty:
+            cookie[self.session_cookie] = self.signer.sign(session.session_id).decode()
+            cookie[self.session_cookie]["max-age"] = self.max_age
+        else:
+            # 세션이 비워졌으면 쿠키 삭제
+            cookie[self.session_cookie] = ""
+            cookie[self.session_cookie]["max-age"] = 0
+        cookie[self.session_cookie]["path"] = "/"
+        cookie[self.session_cookie]["httponly"] = True
+        cookie[self.session_cookie]["secure"] = True
+        cookie[self.session_cookie]["samesite"] = "lax"
+        return cookie.output(header="").strip()
 
-        if request.state.session:
-            new_session_id = self.signer.sign(session_id or request.client.host).decode()
-            await redis.set(f"session:{new_session_id}", json.dumps(request.state.session), ex=3600)
-            response.set_cookie(self.session_cookie, new_session_id, httponly=True, secure=True)
 
-        return response
\ No newline at end of file
+# 라우터에서 세션이 필요할 때: session: dict = Depends(get_session)
+async def get_session(request: Request) -> dict:
+    return await request.state.session.load()
@@ -40,6 +40,12 @@ class CookingRequest(BaseModel):
     food: str = Field(..., description="요리 이름")
     use_ingredients: List[str] = Field(..., description="사용할 재료 리스트")
 
+class RecipeJobRequest(BaseModel):  # 비동기 레시피 작업 요청 (kind별로 필요한 값만 사용)
+    kind: Literal["suggest", "cooking", "quick", "search"] = Field(..., description="작업 종류 (/recipe/{kind}와 동일)")
+    food: Optional[str] = Field(None, description="요리 이름 (cooking)")
+    use_ingredients: Optional[List[str]] = Field(None, description="사용할 재료 리스트 (cooking)")
+    chat: Optional[str] = Field(None, description="입력 문장 (quick, search)")
+
 
 class IngredientCategoriesRequest(BaseModel):
     ingredient_name: str = Field(..., description="식재료 이름", max_length=40)
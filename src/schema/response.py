@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional, List
+from typing import Any, Literal, Optional, List
 from pydantic import BaseModel, EmailStr, Field
 
 #기능 성공 후 출력 메세지
@@ -11,6 +11,14 @@ class UserSchema(BaseModel):
     nickname: str
 
 
+    model_config = {"from_attributes": True}
+
+# 토큰으로 확인한 유저 정보 (캐시용, 비밀번호 제외)
+class AuthUserSchema(BaseModel):
+    id: int
+    email: str
+    is_admin: bool = False
+
     model_config = {"from_attributes": True}
 
 class JWTResponse(BaseModel):
@@ -25,6 +33,7 @@ class IngredientSchema(BaseModel):
 
 class IngredientListSchema(BaseModel):
     ingredients: List[IngredientSchema]
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
 
 
 class BulkCreateResponseSchema(BaseModel):
@@ -45,4 +54,32 @@ class CategorySchema(BaseModel):
 class CategoryListSchema(BaseModel):
     categories: List[CategorySchema]
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+# LLM 응답 형식 (Ollama format 필드의 JSON 스키마로도 사용)
+class SuggestedRecipeSchema(BaseModel):
+    food: str
+    use_ingredients: List[str]
+
+class RecipeSuggestionListSchema(BaseModel):
+    recipes: List[SuggestedRecipeSchema]
+
+class RecipeIngredientSchema(BaseModel):
+    name: str
+    amount: str
+
+class RecipeDetailSchema(BaseModel):
+    food: str
+    use_ingredients: List[RecipeIngredientSchema]
+    steps: List[str]
+    tip: Optional[str] = None
+
+class AIErrorSchema(BaseModel):   # 음식과 관련 없는 입력일 때
+    error: str
+
+# 비동기 레시피 작업 상태 (done이면 result, failed면 error)
+class RecipeJobSchema(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "done", "failed"]
+    result: Optional[Any] = None
+    error: Optional[dict] = None
@@ -7,9 +7,8 @@ from exception.admin_exception import AdminPermissionException, DuplicateCategor
     InvalidCategoryNestingException, CategoryNotFoundException
 from exception.external_exception import UnexpectedException
 from schema.request import IngredientCategoriesRequest, IngredientCategoryUpdateRequest
-from schema.response import CategorySchema, CategoryListSchema
+from schema.response import CategorySchema, CategoryListSchema, AuthUserSchema
 from service.user_service import UserService
-from database.orm import User
 
 
 #관리자 권한 서비스
@@ -25,7 +24,7 @@ class AdminService:
     async def get_current_user(self):
         return await self.user_service.get_user_by_token(self.access_token, self.req)
 
-    async def get_admin_user(self) -> User:
+    async def get_admin_user(self) -> AuthUserSchema:
         user = await self.get_current_user()
         if not user.is_admin:
             security_log(
@@ -121,7 +121,7 @@ class GoogleAuthService:
         #유저정보가 없으면 회원가입 진행
         try:
             password = secrets.token_urlsafe(12)
-            hashed_password = self.user_service.hash_password(password)
+            hashed_password = await self.user_service.hash_password(password)
             new_user = User(
                 email=email,
                 password=hashed_password,
@@ -1,15 +1,19 @@
-from database.orm import Ingredient
 from schema.request import IngredientRequest
 from schema.response import IngredientListSchema, IngredientSchema
 from core.logging import service_log
 from fastapi import Request
 from datetime import date
-from typing import List, Dict
+from typing import List, Dict, Optional
+import base64
+import hashlib
+import json
 
 from exception.ingredient_exception import (
     IngredientConflictException,
-    IngredientNotFoundException
+    IngredientNotFoundException,
+    InvalidCursorException
 )
+from cache.ingredient_cache import IngredientCache
 
 # 식재료 관련 서비스
 
@@ -35,68 +39,76 @@ class IngredientService:
 
         return result["created"][0]
 
-    # 유저의 식재료에 다중 추가
+    # 유저의 식재료에 다중 추가 (이미 가진 재료는 INSERT ... ON CONFLICT로 저장과 동시에 걸러냄)
     async def create_ingredients(self, requests: List[IngredientRequest]) -> Dict:
 
         user = await self.get_current_user()
 
-        # 다중 추가에서 식재료 중복 발생 시 걸러내기 위함
-        created_ingredients = []
-        duplicated_names = []
+        names = list(dict.fromkeys(request.name for request in requests))
+        default_expirations = await self.ingredient_repo.get_default_expirations(names)
+
+        # 요청 안에서 같은 이름이 반복되는 경우 걸러내기 위함
+        seen_names = set()
+
+        ingredient_rows = []
+        manual_logs = []
+        unrecognized_logs = []
 
         for request in requests:
             # 중복 확인
-            existing = await self.ingredient_repo.get_ingredient_by_name(user_id=user.id, name=request.name)
-            if existing:
-                duplicated_names.append(request.name)
+            if request.name in seen_names:
                 continue
+            seen_names.add(request.name)
 
             expiration_date = request.expiration_date
+            default_expiration = default_expirations.get(request.name)
 
             # 유저가 유통기한 입력할 경우 (유통기한에 대한 정보 없던거 로그남기거나 또는 유통기한이 DB와 다를시 로그 남김)
             if expiration_date and isinstance(expiration_date, date):
-                # DB에서 지정된 유통기한 조회
-                default_expiration = await self.ingredient_repo.get_default_expiration(request.name)
-
-                # DB에 유통기한이 존재하지 않을 때
-                if not default_expiration:
-                    # 기본값이 없으면 → unknown    (유통기한에 대한 정보 없던 거 유저가 직접 입력시 -> 업데이트용)
-                    days_left = (expiration_date - date.today()).days
-                    await self.ingredient_repo.save_manual_expiration_log(
-                        user_id=user.id,
-                        ingredient_name=request.name,
-                        expiration_date=days_left,
-                        event_type="unknown"
-                    )
-                elif expiration_date != default_expiration:
-                    # 기본값과 다르면 → different  (유통기한 정보는 있었으나 유저가 입력한 것과 우리 DB의 유통기한이 다를 시 -> 유통기한 편차 조정용)
-                    days_left = (expiration_date - date.today()).days
-                    await self.ingredient_repo.save_manual_expiration_log(
-                        user_id=user.id,
-                        ingredient_name=request.name,
-                        expiration_date=days_left,
-                        event_type="different",
-                    )
-
+                # DB에 유통기한이 존재하지 않을 때 → unknown    (유통기한에 대한 정보 없던 거 유저가 직접 입력시 -> 업데이트용)
+                # 기본값과 다르면 → different  (유통기한 정보는 있었으나 유저가 입력한 것과 우리 DB의 유통기한이 다를 시 -> 유통기한 편차 조정용)
                 # DB의 유통기한과 유저가 입력한 유통기한이 같으면 아무 로그도 남기지 않음 (불필요한 로그 제거)
+                if not default_expiration or expiration_date != default_expiration:
+                    manual_logs.append({
+                        "user_id": user.id,
+                        "ingredient_name": request.name,
+                        "expiration_date": (expiration_date - date.today()).days,
+                        "event_type": "unknown" if not default_expiration else "different",
+                    })
 
             # 유통기한을 입력하지 않았을 경우 (유통기한을 자동 기입하거나 또는 DB에도 유통기한이 없을 때 로그 남김) -> 업데이트 용
             else:
-                default_expiration = await self.ingredient_repo.get_default_expiration(request.name)
-
                 # 유통기한 DB에 존재하지 않을 시 로그 남김
                 if not default_expiration:
-                    await self.ingredient_repo.save_unrecognized_ingredient_log(
-                        user_id=user.id,
-                        ingredient_name=request.name
-                    )
+                    unrecognized_logs.append({"user_id": user.id, "ingredient_name": request.name})
 
                 # DB에 존재할 시 유통기한 자동 기입
                 expiration_date = default_expiration
 
-            ingredient = Ingredient.create(request, user.id, expiration_date=expiration_date)
-            await self.ingredient_repo.create_ingredient(ingredient)
+            ingredient_rows.append({
+                "user_id": user.id,
+                "name": request.name,
+                "expiration_date": expiration_date,
+            })
 
+        ingredients = await self.ingredient_repo.bulk_create_ingredients(
+            user_id=user.id,
+            ingredients=ingredient_rows,
+            manual_logs=manual_logs,
+            unrecognized_logs=unrecognized_logs
+        )
+
+        # 중복 재료 (요청 안에서 반복됐거나, 이미 가지고 있어 DB 유니크 제약에 걸린 재료) - 요청 순서 유지
+        duplicated_names = []
+        pending_names = {ingredient.name for ingredient in ingredients}
+        for request in requests:
+            if request.name in pending_names:
+                pending_names.discard(request.name)
+            else:
+                duplicated_names.append(request.name)
+
+        created_ingredients = []
+        for ingredient in ingredients:
             service_log("IngredientService", f"식재료 '{ingredient.name}' 추가", user_id=user.id)
             created_ingredients.append(IngredientSchema.model_validate(ingredient))
 
@@ -112,13 +124,80 @@ class IngredientService:
         }
 
     # 식재료 조회
-    async def get_ingredients(self):
+    # 식재료 목록이 바뀌지 않았으면(If-None-Match 일치) 조회 없이 (etag, None) 반환
+    async def get_ingredients(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "created",
+        if_none_match: Optional[str] = None
+    ) -> tuple[Optional[str], Optional[IngredientListSchema]]:
         user = await self.get_current_user()
-        ingredients = await self.ingredient_repo.get_ingredients(user.id)
+        after = self.decode_cursor(cursor, sort) if cursor else None
+
+        # 식재료 추가/삭제 시 올라가는 버전 기준 (Redis 장애로 버전을 모르면 ETag 생략)
+        version = await IngredientCache.get_version(user.id)
+        etag = self.make_etag(version, limit, cursor, sort) if version else None
+        if etag and self.etag_matches(etag, if_none_match):
+            return etag, None
+
+        rows = await self.ingredient_repo.get_ingredients(
+            user.id,
+            limit=limit + 1 if limit else None,  # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+            after=after,
+            sort=sort
+        )
+
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self.encode_cursor(rows[-1], sort)
 
         service_log("IngredientService", f"식재료 목록 조회", user_id=user.id)
 
-        return IngredientListSchema(ingredients=ingredients)
+        ingredients = [
+            IngredientSchema(user_id=row.user_id, name=row.name, expiration_date=row.expiration_date)
+            for row in rows
+        ]
+        return etag, IngredientListSchema(ingredients=ingredients, next_cursor=next_cursor)
+
+    # 커서는 마지막 행의 (유통기한, id)를 담은 base64 문자열 (정렬 기준이 다르면 사용 불가)
+    @staticmethod
+    def encode_cursor(row, sort: str) -> str:
+        data = {
+            "s": sort,
+            "e": row.expiration_date.isoformat() if row.expiration_date else None,
+            "i": row.id
+        }
+        return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort: str) -> tuple:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            expiration_date = date.fromisoformat(data["e"]) if data["e"] else None
+            after_id = int(data["i"])
+        except Exception:
+            raise InvalidCursorException()
+
+        if data.get("s") != sort:
+            raise InvalidCursorException(detail="정렬 기준이 다른 페이지 커서입니다")
+        return expiration_date, after_id
+
+    @staticmethod
+    def make_etag(version: str, limit: Optional[int], cursor: Optional[str], sort: str) -> str:
+        digest = hashlib.sha1(f"{version}:{limit}:{cursor}:{sort}".encode()).hexdigest()[:16]
+        return f'W/"{digest}"'
+
+    # 약한 비교 (W/ 접두어 무시)
+    @staticmethod
+    def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates
 
     # 식재료 삭제
     async def delete_ingredient(self, ingredient_name: str):
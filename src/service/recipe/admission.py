@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+from collections import deque
+from contextlib import asynccontextmanager
+
+from core.config import settings
+from core.metrics import LLM_INFLIGHT, LLM_QUEUE_DEPTH, LLM_QUEUE_WAIT, LLM_REJECTED
+from exception.foodthing_exception import AIServiceBusyException, AIServiceUnavailableException
+from service.recipe.ollama_router import OllamaRouter
+
+# Ollama 동시 처리 수 제한 (워커 단위)
+# - 처리 중인 요청이 LLM_MAX_INFLIGHT x 사용 가능한 Ollama 노드 수 이상이면 대기열에서 순서대로 대기
+# - 대기열이 가득 차면 429, 대기 시간이 LLM_QUEUE_TIMEOUT을 넘으면 503으로 바로 거절
+
+class LLMAdmissionController:
+    _inflight: int = 0
+    _waiters: deque = deque()
+
+    # 다운되거나 제외된 노드는 빼고 계산 (모두 빠져도 최소 1대분은 허용)
+    @staticmethod
+    def max_inflight() -> int:
+        return settings.LLM_MAX_INFLIGHT * max(OllamaRouter.available_count(), 1)
+
+    @classmethod
+    def check_capacity(cls):
+        if cls._inflight >= cls.max_inflight() and len(cls._waiters) >= settings.LLM_MAX_QUEUE:
+            LLM_REJECTED.labels(reason="queue_full").inc()
+            raise AIServiceBusyException(retry_after=settings.LLM_RETRY_AFTER)
+
+    @classmethod
+    async def acquire(cls):
+        start = time.perf_counter()
+
+        if cls._inflight < cls.max_inflight() and not cls._waiters:
+            cls._inflight += 1
+            LLM_INFLIGHT.inc()
+            LLM_QUEUE_WAIT.observe(0)
+            return
+
+        cls.check_capacity()
+
+        waiter = asyncio.get_running_loop().create_future()
+        cls._waiters.append(waiter)
+        LLM_QUEUE_DEPTH.inc()
+
+        try:
+            await asyncio.wait_for(waiter, timeout=settings.LLM_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            LLM_REJECTED.labels(reason="queue_timeout").inc()
+            raise AIServiceUnavailableException(
+                detail="AI 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요",
+                retry_after=settings.LLM_RETRY_AFTER
+            )
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소된 경우 다음 대기자에게 넘김
+            if waiter.done() and not waiter.cancelled():
+                cls.release()
+            raise
+        finally:
+            if waiter in cls._waiters:
+                cls._waiters.remove(waiter)
+                LLM_QUEUE_DEPTH.dec()
+
+        LLM_QUEUE_WAIT.observe(time.perf_counter() - start)
+
+    @classmethod
+    def release(cls):
+        # 대기자가 있으면 처리 슬롯을 그대로 넘김 (inflight 수 유지)
+        # 노드가 빠져 한도를 넘은 상태면 넘기지 않고 반납
+        while cls._waiters and cls._inflight <= cls.max_inflight():
+            waiter = cls._waiters.popleft()
+            LLM_QUEUE_DEPTH.dec()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        cls._inflight -= 1
+        LLM_INFLIGHT.dec()
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(cls):
+        await cls.acquire()
+        try:
+            yield
+        finally:
+            cls.release()
@@ -1,12 +1,16 @@
 import json
 import re
+import time
 import httpx
 
+from pydantic import TypeAdapter, ValidationError
+
 from fastapi import Depends, Request
 from sqlalchemy import select
 
 from exception.foodthing_exception import (
     AIServiceException,
+    AIServiceUnavailableException,
     AINullResponseException,
     AIJsonDecodeException,
     InvalidAIRequestException
@@ -20,16 +24,27 @@ from exception.auth_exception import (
 from service.auth.jwt_handler import get_access_token
 from database.orm import Ingredient
 from core.config import settings
+from core.connection import OllamaClient
 from database.repository.user_repository import UserRepository
 from service.user_service import UserService
-from service.recipe.prompt_builder import PromptBuilder
-from core.logging import service_log
+from service.recipe.prompt_builder import Prompt, PromptBuilder
+from service.recipe.ollama_monitor import OllamaHealthMonitor
+from service.recipe.ollama_router import OllamaRouter
+from service.recipe.ollama_warmup import OllamaWarmer
+from service.recipe.admission import LLMAdmissionController
+from cache.recipe_cache import RecipeCache
+from cache.ingredient_cache import IngredientCache
+from cache.single_flight import SingleFlight
+from core.logging import service_log, loggers
+from core.metrics import OLLAMA_GENERATION_LATENCY, OLLAMA_TOKENS
+from exception.base_exception import CustomException
 
 # LLM 서비스 관련
 
+error_logger = loggers["error"]
+
 class CookAIService:
     def __init__(self, user_service: UserService, user_repo: UserRepository, access_token: str, req: Request):
-        self.ollama_url = settings.OLLAMA_URL
         self.model_name = settings.MODEL_NAME
         self.num_predict = 2000
         self.user_service = user_service
@@ -51,9 +66,11 @@ class CookAIService:
 
         return user
 
-    # 식재료 조회
-    async def get_user_ingredients(self):
-        user = await self._get_authenticated_user()
+    # 식재료 조회 (식재료가 바뀌지 않았으면 Redis 스냅샷 사용)
+    async def get_user_ingredients(self, user, version: str | None = None):
+        cached = await IngredientCache.get_names(user.id, version)
+        if cached is not None:
+            return cached
 
         try:
             ingredients = await self.user_repo.session.execute(
@@ -62,86 +79,259 @@ class CookAIService:
         except Exception as e:
             raise AIServiceException(detail=f"DB에서 재료 조회 실패: {str(e)}")
 
-        return [name for (name,) in ingredients.all()]
+        names = [name for (name,) in ingredients.all()]
+        await IngredientCache.set_names(user.id, version, names)
+        return names
 
     # ollama 호출
-    async def call_ollama(self, prompt):
-        health_url = self.ollama_url.replace("/api/generate", "/")
-        timeout = httpx.Timeout(50.0)
+    async def call_ollama(self, prompt: Prompt):
+        # 헬스체크는 백그라운드에서 주기적으로 수행, 다운 상태면 바로 실패 처리
+        if not OllamaHealthMonitor.is_up:
+            raise AIServiceUnavailableException()
+
+        client = OllamaClient.get_client()
+        payload = self._build_payload(prompt, stream=False)
+
+        # 처리 슬롯을 얻은 뒤 처리 중인 요청이 가장 적은 노드로 전송
+        async with LLMAdmissionController.slot(), OllamaRouter.acquire() as backend:
+            try:
+                start = time.perf_counter()
+                response = await client.post(backend.url, json=payload, timeout=OllamaWarmer.request_timeout())
+                elapsed = time.perf_counter() - start
+            except httpx.ConnectError as e:
+                OllamaRouter.report_failure(backend, str(e))
+                raise AIServiceUnavailableException(detail=f"Ollama 서버에 연결할 수 없습니다: {str(e)}")
+            except httpx.RequestError as e:
+                OllamaRouter.report_failure(backend, str(e) or type(e).__name__)
+                raise AIServiceException(detail=f"Ollama 네트워크 오류: {str(e)}")
+
+        if response.status_code >= 500:
+            OllamaRouter.report_failure(backend, f"status {response.status_code}")
+        elif response.status_code == 200:
+            OllamaRouter.report_success(backend)
+            OllamaWarmer.ready = True
+        if response.status_code != 200:
+            raise AIServiceException(detail=f"Ollama 호출 실패: {response.status_code} - {response.text}")
 
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # 서버 확인 먼저 (필요없는 로딩 없애기 위해)
-                await client.get(health_url)
-        except httpx.RequestError as e:
-            raise AIServiceException(detail=f"Ollama 서버에 연결할 수 없습니다: {str(e)}")
+        data = response.json()
+        self._record_usage("generate", elapsed, data)
+        return self._parse_response(data.get("response", ""), prompt.response)
+
+    # ollama 스트리밍 호출 (SSE 이벤트 제너레이터 반환)
+    async def stream_ollama(self, prompt: Prompt, cache_key: str | None = None):
+        if not OllamaHealthMonitor.is_up:
+            raise AIServiceUnavailableException()
+
+        # 대기열이 이미 가득 찼으면 스트림 시작 전에 429 반환
+        LLMAdmissionController.check_capacity()
 
-        payload = {
+        return self._stream_events(prompt, cache_key)
+
+    # system(템플릿 고정 부분)은 따로 보내 요청마다 바뀌는 부분만 prompt로 전달
+    def _build_payload(self, prompt: Prompt, stream: bool) -> dict:
+        return {
             "model": self.model_name,
-            "prompt": prompt,
-            "stream": False,
+            "system": prompt.system,
+            "prompt": prompt.text,
+            "format": prompt.format,  # 응답을 JSON 스키마에 맞게 생성하도록 제한
+            "stream": stream,
+            "keep_alive": settings.OLLAMA_KEEP_ALIVE,
             "options": {"num_predict": self.num_predict},
         }
 
+    # 토큰은 받는 즉시 전달하고, 마지막에 전체 응답을 JSON으로 검증해서 result 이벤트로 전달
+    async def _stream_events(self, prompt: Prompt, cache_key: str | None = None):
+        client = OllamaClient.get_client()
+        payload = self._build_payload(prompt, stream=True)
+        chunks = []
 
+        backend = None
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(self.ollama_url, json=payload)
-        except httpx.RequestError as e:
-            raise AIServiceException(detail=f"Ollama 네트워크 오류: {str(e)}")
-
-        if response.status_code != 200:
-            raise AIServiceException(detail=f"Ollama 호출 실패: {response.status_code} - {response.text}")
-
-        response_text = response.json().get("response", "").strip()
+            async with (
+                LLMAdmissionController.slot(),
+                OllamaRouter.acquire() as backend,
+                client.stream("POST", backend.url, json=payload, timeout=OllamaWarmer.request_timeout()) as response
+            ):
+                start = time.perf_counter()
+                if response.status_code != 200:
+                    if response.status_code >= 500:
+                        OllamaRouter.report_failure(backend, f"status {response.status_code}")
+                    body = (await response.aread()).decode(errors="replace")
+                    raise AIServiceException(detail=f"Ollama 호출 실패: {response.status_code} - {body}")
+                OllamaRouter.report_success(backend)
+                OllamaWarmer.ready = True
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    token = data.get("response", "")
+                    if token:
+                        chunks.append(token)
+                        yield self._sse("token", {"token": token})
+                    if data.get("done"):
+                        self._record_usage("stream", time.perf_counter() - start, data)
+                        break
+
+            result = self._parse_response("".join(chunks), prompt.response)
+            if cache_key:
+                await RecipeCache.set(cache_key, result)
+            yield self._sse("result", result)
+
+        except CustomException as e:
+            e.log(error_logger, self.req.url.path if self.req else "")
+            yield self._sse("error", {"code": e.code, "detail": e.detail})
+        except httpx.ConnectError as e:
+            if backend:
+                OllamaRouter.report_failure(backend, str(e))
+            yield self._sse("error", {"code": "AI_SERVICE_UNAVAILABLE", "detail": f"Ollama 서버에 연결할 수 없습니다: {str(e)}"})
+        except (httpx.RequestError, json.JSONDecodeError) as e:
+            if backend and isinstance(e, httpx.RequestError):
+                OllamaRouter.report_failure(backend, str(e) or type(e).__name__)
+            error_logger.error(f"[Ollama Stream] {type(e).__name__}: {str(e)}")
+            yield self._sse("error", {"code": "AI_SERVICE_ERROR", "detail": f"Ollama 스트리밍 오류: {str(e)}"})
+
+    # 생성 시간과 토큰 수 기록 (토큰 수는 Ollama 마지막 응답의 prompt_eval_count, eval_count)
+    @staticmethod
+    def _record_usage(mode: str, elapsed: float, data: dict):
+        OLLAMA_GENERATION_LATENCY.labels(mode).observe(elapsed)
+        OLLAMA_TOKENS.labels("prompt").inc(data.get("prompt_eval_count") or 0)
+        OLLAMA_TOKENS.labels("completion").inc(data.get("eval_count") or 0)
+
+    @staticmethod
+    def _sse(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    # 응답에서 JSON 본문 추출 및 파싱 후 응답 형식 검증
+    @classmethod
+    def _parse_response(cls, response_text: str, response: TypeAdapter):
+        response_text = response_text.strip()
 
         if not response_text:
             raise AINullResponseException()
 
-        match = re.search(r"```json\s*([\s\S]+?)\s*```", response_text)
+        match = re.search(r"```(?:json)?\s*([\s\S]+?)\s*```", response_text)
         if match:
             response_text = match.group(1).strip()
 
         try:
-            return json.loads(response_text)
+            data = json.loads(response_text)
+        except json.JSONDecodeError:
+            data = cls._repair_json(response_text)
+
+        try:
+            return response.dump_python(response.validate_python(data), mode="json", exclude_none=True)
+        except ValidationError as e:
+            raise AIJsonDecodeException(detail=f"응답 형식 검증 실패: {e.error_count()}개 항목 오류 - {response_text}")
+
+    # 흔한 형식 오류만 보정 (앞뒤 설명 문장, 마지막 쉼표), 그래도 안 되면 실패 처리
+    @staticmethod
+    def _repair_json(response_text: str):
+        start = response_text.find("{")
+        end = response_text.rfind("}")
+        if start == -1 or end <= start:
+            raise AIJsonDecodeException(detail=f"응답 파싱 실패: {response_text}")
+
+        repaired = re.sub(r",\s*([}\]])", r"\1", response_text[start:end + 1])
+        try:
+            return json.loads(repaired)
         except json.JSONDecodeError:
             raise AIJsonDecodeException(detail=f"응답 파싱 실패: {response_text}")
 
+    # 캐시된 결과를 SSE 한 번에 전달
+    async def _cached_events(self, result):
+        yield self._sse("result", result)
+
+    # stream=True면 SSE 제너레이터, 아니면 완성된 JSON 반환 (cache_key가 있으면 캐시 먼저 확인)
+    async def _generate(self, prompt: Prompt, stream: bool, cache_key: str | None = None):
+        if cache_key:
+            cached = await RecipeCache.get(cache_key)
+            if cached is not None:
+                return self._cached_events(cached) if stream else cached
+
+        if stream:
+            return await self.stream_ollama(prompt, cache_key)
+
+        # 동시에 들어온 같은 프롬프트는 한 번만 생성
+        return await SingleFlight.run(
+            SingleFlight.make_key(f"{prompt.version}\n{prompt.text}"),
+            lambda: self._call_and_cache(prompt, cache_key)
+        )
+
+    async def _call_and_cache(self, prompt: Prompt, cache_key: str | None):
+        result = await self.call_ollama(prompt)
+        if cache_key:
+            await RecipeCache.set(cache_key, result)
+        return result
+
+    # 요청 종류별 프롬프트와 캐시 키 생성 (바로 응답, 스트리밍, 비동기 작업 공용)
+    async def _build_suggest(self, user):
+        version = await IngredientCache.get_version(user.id)
+        user_ingredients = await self.get_user_ingredients(user, version)
+
+        # 추천 결과는 식재료 구성 기준으로 캐시 (냉장고가 바뀌기 전까지 바로 반환)
+        prompt = PromptBuilder.build_suggestion_prompt(user_ingredients)
+        cache_key = RecipeCache.make_key(
+            "suggest",
+            prompt.version,
+            RecipeCache.normalize_list(user_ingredients)
+        )
+        return prompt, cache_key
+
+    @staticmethod
+    def _build_recipe(request_data: dict):
+        food = request_data.get("food")
+        use_ingredients = request_data.get("use_ingredients", [])
+
+        if not food or not isinstance(use_ingredients, list):
+            raise InvalidAIRequestException(detail="올바른 'food' 및 'use_ingredients' 값을 제공해야 합니다.")
+
+        prompt = PromptBuilder.build_recipe_prompt(food, use_ingredients)
+        cache_key = RecipeCache.make_key(
+            "recipe",
+            prompt.version,
+            RecipeCache.normalize_text(food),
+            RecipeCache.normalize_list(use_ingredients)
+        )
+        return prompt, cache_key
+
+    @staticmethod
+    def _build_quick(chat: str):
+        return PromptBuilder.build_quick_prompt(chat), None
+
+    @staticmethod
+    def _build_search(chat: str):
+        prompt = PromptBuilder.build_search_prompt(chat)
+        return prompt, RecipeCache.make_key("search", prompt.version, RecipeCache.normalize_text(chat))
+
     # 만들 수 있는 요리 리스트 출력
-    async def get_suggest_recipes(self):
+    async def get_suggest_recipes(self, stream: bool = False):
         user = await self._get_authenticated_user()
-        user_ingredients = await self.get_user_ingredients()
 
         service_log("RecipeService", f"AI 추천 레시피 요청", user_id=user.id)
 
-        prompt = PromptBuilder.build_suggestion_prompt(user_ingredients)
-        return await self.call_ollama(prompt)
+        prompt, cache_key = await self._build_suggest(user)
+        return await self._generate(prompt, stream, cache_key)
 
     # 요리 레시피 출력
-    async def get_food_recipe(self, request_data: dict):
+    async def get_food_recipe(self, request_data: dict, stream: bool = False):
         user = await self._get_authenticated_user()
 
-        food = request_data.get("food")
-        use_ingredients = request_data.get("use_ingredients", [])
+        service_log("RecipeService", f"AI 레시피 요청: '{request_data.get('food')}'", user_id=user.id)
 
-        service_log("RecipeService", f"AI 레시피 요청: '{food}'", user_id=user.id)
-
-        if not food or not isinstance(use_ingredients, list):
-            raise InvalidAIRequestException(detail="올바른 'food' 및 'use_ingredients' 값을 제공해야 합니다.")
-
-        prompt = PromptBuilder.build_recipe_prompt(food, use_ingredients)
-        return await self.call_ollama(prompt)
+        prompt, cache_key = self._build_recipe(request_data)
+        return await self._generate(prompt, stream, cache_key)
 
     # 간단한 입력식 레시피 출력 (식재료만 입력)
-    async def get_quick_recipe(self, chat: str):
+    async def get_quick_recipe(self, chat: str, stream: bool = False):
         user = await self._get_authenticated_user()
-        prompt = PromptBuilder.build_quick_prompt(chat)
+        prompt, _ = self._build_quick(chat)
         service_log("RecipeService", f"입력식 AI 레시피 요청: '{chat}'", user_id=user.id)
-        return await self.call_ollama(prompt)
+        return await self._generate(prompt, stream)
 
     # 레시피 검색(식재료 없이 요리이름만 입력)
-    async def get_search_recipe(self, chat: str):
+    async def get_search_recipe(self, chat: str, stream: bool = False):
         user = await self._get_authenticated_user()
-        prompt = PromptBuilder.build_search_prompt(chat)
+        prompt, cache_key = self._build_search(chat)
         service_log("RecipeService", f"레시피 검색 요청: '{chat}'", user_id=user.id)
-        return await self.call_ollama(prompt)
\ No newline at end of file
+        return await self._generate(prompt, stream, cache_key)
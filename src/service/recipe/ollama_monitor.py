@@ -0,0 +1,77 @@
+import asyncio
+import time
+import httpx
+
+from core.config import settings
+from core.connection import OllamaClient
+from core.logging import loggers
+from service.recipe.ollama_router import OllamaBackend, OllamaRouter
+
+# Ollama 노드 상태 백그라운드 확인 (요청마다 헬스체크 GET 보내지 않기 위함)
+
+background_logger = loggers["background"]
+
+class OllamaHealthMonitor:
+    is_up: bool = False                 # 응답하는 노드가 하나라도 있는지
+    last_checked: float | None = None   # 마지막 헬스체크 시각 (time.time())
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    def refresh(cls):
+        was_up = cls.is_up
+        cls.is_up = any(backend.is_up for backend in OllamaRouter.backends())
+        if was_up and not cls.is_up:
+            background_logger.warning("응답하는 Ollama 노드가 없습니다")
+        elif not was_up and cls.is_up:
+            background_logger.info("Ollama 서버 연결 복구")
+
+    @classmethod
+    async def probe_backend(cls, backend: OllamaBackend):
+        client = OllamaClient.get_client()
+        start = time.perf_counter()
+
+        try:
+            response = await client.get(backend.health_url, timeout=settings.OLLAMA_HEALTH_TIMEOUT)
+        except httpx.RequestError as e:
+            OllamaRouter.mark_health(backend, False, str(e) or type(e).__name__)
+            return
+
+        if response.status_code == 200:
+            backend.latency = round(time.perf_counter() - start, 4)
+            OllamaRouter.mark_health(backend, True)
+        else:
+            OllamaRouter.mark_health(backend, False, f"status {response.status_code}")
+
+    # 모든 노드를 동시에 확인
+    @classmethod
+    async def probe(cls) -> bool:
+        await asyncio.gather(*(cls.probe_backend(backend) for backend in OllamaRouter.backends()))
+        cls.refresh()
+        cls.last_checked = time.time()
+        return cls.is_up
+
+    @classmethod
+    async def _run(cls):
+        while True:
+            await asyncio.sleep(settings.OLLAMA_HEALTH_INTERVAL)
+            try:
+                await cls.probe()
+            except Exception as e:
+                background_logger.error(f"Ollama 헬스체크 중 오류: {e}")
+
+    @classmethod
+    async def start(cls):
+        # 첫 상태는 바로 확인하고, 이후 주기적으로 확인
+        if not await cls.probe():
+            background_logger.warning("Ollama 서버에 연결할 수 없는 상태로 시작합니다")
+        cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls):
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
@@ -0,0 +1,112 @@
+import random
+import time
+
+from contextlib import asynccontextmanager
+
+from core.config import settings
+from core.logging import loggers
+from core.metrics import OLLAMA_BACKEND_EJECTIONS, OLLAMA_BACKEND_INFLIGHT
+from exception.foodthing_exception import AIServiceUnavailableException
+
+# 여러 Ollama 노드로 요청 분산 (워커 단위)
+# - 처리 중인 요청 수 / 가중치가 가장 작은 노드 선택 (least outstanding requests)
+# - 연속 실패(연결 오류, 타임아웃, 5xx)가 OLLAMA_EJECT_FAILURES번이면 OLLAMA_EJECT_SECONDS 동안 제외
+# - 제외 시간이 지나면 다시 포함 (헬스체크는 연결 여부만 반영, / 응답만으로 제외를 풀지 않음)
+
+background_logger = loggers["background"]
+
+class OllamaBackend:
+    def __init__(self, url: str, weight: float = 1.0):
+        self.url = url                       # generate 엔드포인트
+        self.weight = weight
+        self.inflight = 0
+        self.failures = 0                    # 연속 실패 횟수
+        self.ejected_until = 0.0             # time.monotonic() 기준
+        self.is_up = True                    # 마지막 헬스체크 결과
+        self.latency: float | None = None    # 마지막 헬스체크 응답 시간(초)
+
+    @property
+    def health_url(self) -> str:
+        return self.url.replace("/api/generate", "/")
+
+    def available(self, now: float) -> bool:
+        return self.is_up and now >= self.ejected_until
+
+    def load(self) -> float:
+        return (self.inflight + 1) / self.weight
+
+
+class OllamaRouter:
+    _backends: list[OllamaBackend] | None = None
+
+    # OLLAMA_BACKENDS="http://gpu1:11434=2,http://cpu1:11434=1" (비어 있으면 OLLAMA_URL 한 대)
+    @staticmethod
+    def parse_backends(value: str) -> list[OllamaBackend]:
+        backends = []
+        for item in value.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            url, _, weight = item.rpartition("=") if "=" in item else (item, "", "")
+            url = url.rstrip("/")
+            if not url.endswith("/api/generate"):
+                url += "/api/generate"
+            backends.append(OllamaBackend(url, float(weight or 1)))
+        return backends
+
+    @classmethod
+    def backends(cls) -> list[OllamaBackend]:
+        if cls._backends is None:
+            cls._backends = cls.parse_backends(settings.OLLAMA_BACKENDS) or [OllamaBackend(settings.OLLAMA_URL)]
+        return cls._backends
+
+    @classmethod
+    def available_count(cls) -> int:
+        now = time.monotonic()
+        return sum(1 for backend in cls.backends() if backend.available(now))
+
+    @classmethod
+    def pick(cls) -> OllamaBackend:
+        now = time.monotonic()
+        candidates = [backend for backend in cls.backends() if backend.available(now)]
+        if not candidates:
+            raise AIServiceUnavailableException(retry_after=settings.LLM_RETRY_AFTER)
+
+        lowest = min(backend.load() for backend in candidates)
+        return random.choice([backend for backend in candidates if backend.load() == lowest])
+
+    @classmethod
+    @asynccontextmanager
+    async def acquire(cls):
+        backend = cls.pick()
+        backend.inflight += 1
+        OLLAMA_BACKEND_INFLIGHT.labels(backend.url).inc()
+        try:
+            yield backend
+        finally:
+            backend.inflight -= 1
+            OLLAMA_BACKEND_INFLIGHT.labels(backend.url).dec()
+
+    @staticmethod
+    def report_success(backend: OllamaBackend):
+        backend.failures = 0
+
+    @staticmethod
+    def report_failure(backend: OllamaBackend, reason: str):
+        backend.failures += 1
+        if backend.failures >= settings.OLLAMA_EJECT_FAILURES:
+            backend.failures = 0
+            backend.ejected_until = time.monotonic() + settings.OLLAMA_EJECT_SECONDS
+            OLLAMA_BACKEND_EJECTIONS.labels(backend.url).inc()
+            background_logger.warning(
+                f"Ollama 노드 제외 ({settings.OLLAMA_EJECT_SECONDS}s): {backend.url} - {reason}"
+            )
+
+    # 헬스체크 결과 반영 (generate 실패로 인한 제외 시간은 그대로 유지)
+    @staticmethod
+    def mark_health(backend: OllamaBackend, is_up: bool, reason: str = ""):
+        if is_up and not backend.is_up:
+            background_logger.info(f"Ollama 노드 복구: {backend.url}")
+        elif not is_up and backend.is_up:
+            background_logger.warning(f"Ollama 노드 연결 끊김: {backend.url} - {reason}")
+        backend.is_up = is_up
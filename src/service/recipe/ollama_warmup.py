@@ -0,0 +1,123 @@
+import asyncio
+import uuid
+from datetime import datetime
+
+import httpx
+
+from core.config import settings
+from core.connection import OllamaClient, RedisClient
+from core.logging import KST, loggers
+from service.recipe.ollama_monitor import OllamaHealthMonitor
+from service.recipe.ollama_router import OllamaBackend, OllamaRouter
+
+# Ollama 모델 미리 로드 + 영업 시간 동안 모델이 내려가지 않도록 주기적으로 ping
+# prompt 없이 generate를 보내면 Ollama는 모델만 로드하고 바로 응답함
+# 로드는 백그라운드에서 진행 (Ollama가 느려도 앱 시작과 LLM 외 API는 막지 않음)
+# 로드 완료 전 LLM 요청은 모델 로드 시간까지 기다리도록 읽기 타임아웃을 늘려서 보냄
+
+background_logger = loggers["background"]
+
+class OllamaWarmer:
+    PING_LOCK_KEY = "ollama:keepalive:lock"   # 여러 워커 중 한 곳만 ping
+    ready: bool = False                       # 모델 로드(또는 생성 성공)를 확인했는지
+    _task: asyncio.Task | None = None
+
+    # 모델 로드 전이면 로드 시간까지 기다리도록 읽기 타임아웃 연장
+    @classmethod
+    def request_timeout(cls):
+        if cls.ready:
+            return httpx.USE_CLIENT_DEFAULT
+        return httpx.Timeout(settings.OLLAMA_WARMUP_TIMEOUT, connect=settings.OLLAMA_CONNECT_TIMEOUT)
+
+    @staticmethod
+    def in_business_hours(now: datetime | None = None) -> bool:
+        hour = (now or datetime.now(tz=KST)).hour
+        start, end = settings.OLLAMA_BUSINESS_HOUR_START, settings.OLLAMA_BUSINESS_HOUR_END
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end   # 자정을 넘기는 경우 (예: 18시 ~ 2시)
+
+    @classmethod
+    async def load_model(cls, backend: OllamaBackend, timeout: float) -> bool:
+        client = OllamaClient.get_client()
+        payload = {"model": settings.MODEL_NAME, "keep_alive": settings.OLLAMA_KEEP_ALIVE, "stream": False}
+
+        try:
+            response = await client.post(backend.url, json=payload, timeout=timeout)
+        except httpx.RequestError as e:
+            background_logger.warning(f"Ollama 모델 로드 실패 ({backend.url}): {type(e).__name__} {e}")
+            return False
+
+        if response.status_code != 200:
+            background_logger.warning(f"Ollama 모델 로드 실패 ({backend.url}): {response.status_code} - {response.text}")
+            return False
+        return True
+
+    # 응답하는 모든 노드에 동시에 모델 로드
+    @classmethod
+    async def load_all(cls) -> int:
+        backends = [backend for backend in OllamaRouter.backends() if backend.is_up]
+        results = await asyncio.gather(*(cls.load_model(backend, settings.OLLAMA_WARMUP_TIMEOUT) for backend in backends))
+        if any(results):
+            cls.ready = True
+        return sum(results)
+
+    @classmethod
+    async def warm_up(cls):
+        if not settings.OLLAMA_WARMUP_ENABLED:
+            return
+        if not OllamaHealthMonitor.is_up:
+            background_logger.warning("Ollama 서버가 응답하지 않아 모델 로드를 건너뜁니다")
+            return
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        loaded = await cls.load_all()
+        if loaded:
+            background_logger.info(
+                f"Ollama 모델 로드 완료: {settings.MODEL_NAME} 노드 {loaded}대 ({round(loop.time() - start, 2)}s)"
+            )
+
+    @classmethod
+    async def _acquire_ping_turn(cls) -> bool:
+        try:
+            redis = await RedisClient.get_redis()
+            ttl = max(int(settings.OLLAMA_KEEPALIVE_PING_INTERVAL) - 1, 1)
+            return bool(await redis.set(cls.PING_LOCK_KEY, uuid.uuid4().hex, nx=True, ex=ttl))
+        except Exception as e:
+            # Redis 장애 시에는 각 워커가 ping (중복 ping은 무해함)
+            background_logger.warning(f"Ollama keep-alive 락 확인 실패: {e}")
+            return True
+
+    @classmethod
+    async def _run(cls):
+        try:
+            await cls.warm_up()
+        except Exception as e:
+            background_logger.error(f"Ollama 모델 로드 중 오류: {e}")
+
+        if not settings.OLLAMA_WARMUP_ENABLED:
+            return
+        while True:
+            await asyncio.sleep(settings.OLLAMA_KEEPALIVE_PING_INTERVAL)
+            try:
+                if OllamaHealthMonitor.is_up and cls.in_business_hours() and await cls._acquire_ping_turn():
+                    await cls.load_all()
+            except Exception as e:
+                background_logger.error(f"Ollama keep-alive 중 오류: {e}")
+
+    @classmethod
+    async def start(cls):
+        # 미리 로드하지 않으면 로드 여부를 알 수 없으므로 기본 타임아웃 사용
+        cls.ready = not settings.OLLAMA_WARMUP_ENABLED
+        cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls):
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
@@ -1,123 +1,198 @@
+import hashlib
 import json
+from string import Template
+from textwrap import dedent
+from typing import Any, NamedTuple, Union
+
+from pydantic import TypeAdapter
+
+from schema.response import AIErrorSchema, RecipeDetailSchema, RecipeSuggestionListSchema
 
 # 프롬프트 관련
+# 템플릿은 import 시 한 번만 정리(dedent)해두고, 요청마다 바뀌는 부분만 채움
+# system(역할, 조건, 예시)은 요청마다 같으므로 Ollama에 따로 보내 앞부분 재계산을 줄임
+# 템플릿마다 응답 형식(pydantic 모델)을 지정해 Ollama format(JSON 스키마)과 응답 검증에 사용
+
+
+class Prompt(NamedTuple):
+    kind: str
+    version: str   # 템플릿 내용 기준 해시 (레시피 캐시 키에 포함됨)
+    system: str
+    text: str
+    format: dict              # Ollama에 보낼 응답 JSON 스키마
+    response: TypeAdapter     # 응답 검증용
+
+
+class PromptTemplate:
+    def __init__(self, kind: str, system: str, user: str, response_model: Any):
+        self.kind = kind
+        self.system = dedent(system).strip()
+        self.user = Template(dedent(user).strip())
+        self.response = TypeAdapter(response_model)
+        self.format = self.response.json_schema()
+        # 프롬프트 내용이나 응답 형식이 바뀌면 버전도 자동으로 바뀌어 이전 캐시를 쓰지 않음
+        self.version = hashlib.sha256(
+            f"{kind}\n{self.system}\n{self.user.template}\n{json.dumps(self.format, sort_keys=True)}".encode()
+        ).hexdigest()[:12]
+
+    def render(self, **values) -> Prompt:
+        return self.with_text(self.user.substitute(**values))
+
+    # 이미 채워진 본문으로 프롬프트 복원 (비동기 작업 큐에서 꺼낼 때 사용)
+    def with_text(self, text: str) -> Prompt:
+        return Prompt(self.kind, self.version, self.system, text, self.format, self.response)
+
+
+SUGGEST_TEMPLATE = PromptTemplate(
+    "suggest",
+    system="""
+    당신은 전문 요리사 AI입니다. 사용자가 보유한 재료를 최대한 활용하여 만들 수 있는 요리 6가지를 추천하세요.
+
+    필수 조건:
+    - 반드시 사용자가 가진 재료만 사용하세요.
+    - 추가 재료는 절대 포함하지 마세요.
+    - 현실적으로 만들 수 있는 요리만 추천하세요.
+    - 응답은 반드시 JSON 형식이어야 하며, 그 외 설명은 포함하지 마세요.
+
+    참고 예시 (출력은 이 형식만 따르되 내용은 새로 생성):
+    ```json
+    {
+      "recipes": [
+        {
+          "food": "계란 볶음밥",
+          "use_ingredients": ["밥", "계란", "대파", "소금", "후춧가루"]
+        }
+      ]
+    }
+    ```
+    """,
+    user="""
+    📌 사용 가능한 재료 목록: $ingredients
+    """,
+    response_model=RecipeSuggestionListSchema
+)
+
+RECIPE_TEMPLATE = PromptTemplate(
+    "recipe",
+    system="""
+    당신은 전문 요리사 AI입니다. 사용자가 요청한 음식의 상세 조리법을 제공합니다.
+
+    필수 조건:
+    - 반드시 요청된 음식과 제공된 재료만 사용하세요.
+    - 재료의 양을 구체적으로 명시하세요. (예: 100g, 1컵 등)
+    - 레시피는 최소 450자 이상, 단계별로 구성하세요.
+    - 추가 팁이 있다면 포함하세요.
+    - 응답은 반드시 JSON 형식이며, 코드 블록 없이 JSON 본문만 출력하세요.
+
+    참고 예시:
+    ```json
+    {
+      "food": "계란 오믈렛",
+      "use_ingredients": [
+        {"name": "계란", "amount": "2개"},
+        {"name": "양파", "amount": "50g"},
+        {"name": "치즈", "amount": "30g"},
+        {"name": "우유", "amount": "50ml"}
+      ],
+      "steps": [
+        "양파를 잘게 썰어 준비합니다.",
+        "볼에 계란을 깨서 우유, 치즈와 섞어줍니다.",
+        "팬에 양파를 볶은 후 혼합물을 붓고 천천히 익힙니다.",
+        "반으로 접고 완성합니다."
+      ],
+      "tip": "우유를 넣으면 더 부드럽게 익습니다."
+    }
+    ```
+    """,
+    user="""
+    요청된 음식: $food
+    사용 가능한 재료: $ingredients
+    """,
+    response_model=RecipeDetailSchema
+)
+
+QUICK_TEMPLATE = PromptTemplate(
+    "quick",
+    system="""
+    당신은 요리 전문가 AI입니다. 사용자가 입력한 재료를 활용해 만들 수 있는 1가지 요리를 추천하세요.
+
+    필수 조건:
+    - 입력된 재료만 사용하세요.
+    - 음식과 관련 없는 질문, 부적절한 콘텐츠(비속어, 성적, 정치적, 종교적 표현 등)가 포함된 경우 응답하지 마세요.
+    - 조리법은 최소 350자 이상, 단계별로 구성하세요.
+    - 재료의 사용량, 조리 팁을 포함하세요.
+    - 반드시 JSON 형식으로 응답하세요. 코드 블록 없이 본문만 출력하세요.
+
+    잘못된 입력일 경우:
+    {"error": "정확한 음식명을 입력해 주세요."}
+
+    참고 예시:
+    {
+      "food": "치즈 오믈렛",
+      "use_ingredients": [
+        {"name": "계란", "amount": "2개"},
+        {"name": "치즈", "amount": "30g"},
+        {"name": "우유", "amount": "50ml"}
+      ],
+      "steps": ["..."],
+      "tip": "약불에서 천천히 익히세요."
+    }
+    """,
+    user="""
+    입력된 재료: "$chat"
+    """,
+    response_model=Union[RecipeDetailSchema, AIErrorSchema]
+)
+
+SEARCH_TEMPLATE = PromptTemplate(
+    "search",
+    system="""
+    당신은 요리 전문가 AI입니다. 사용자가 입력한 음식명에 대한 정확한 레시피를 제공합니다.
+
+    필수 조건:
+    - 해당 음식만 다루고, 추천이나 설명은 생략하세요.
+    - 음식과 무관한 질문, 부적절한 콘텐츠(비속어, 성적, 정치적, 종교적 표현 등)가 포함된 경우 응답하지 마세요.
+    - 재료와 양, 조리법, 팁을 포함한 JSON을 제공하세요.
+    - 최소 300자 이상의 단계별 설명 포함.
+    - 반드시 JSON 형식 본문만 응답하세요.
+
+    잘못된 입력일 경우:
+    {"error": "정확한 음식명을 입력해 주세요."}
+
+    참고 예시:
+    {
+      "food": "된장찌개",
+      "use_ingredients": [...],
+      "steps": [...],
+      "tip": "육수에 마늘을 추가하세요."
+    }
+    """,
+    user="""
+    입력된 음식명: "$chat"
+    """,
+    response_model=Union[RecipeDetailSchema, AIErrorSchema]
+)
+
 
 class PromptBuilder:
+    # 종류별 템플릿 (버전 확인: PromptBuilder.TEMPLATES["suggest"].version)
+    TEMPLATES = {
+        template.kind: template
+        for template in (SUGGEST_TEMPLATE, RECIPE_TEMPLATE, QUICK_TEMPLATE, SEARCH_TEMPLATE)
+    }
 
     @staticmethod
-    def build_suggestion_prompt(user_ingredients: list) -> str:
-        return f"""
-        당신은 전문 요리사 AI입니다. 사용자가 보유한 재료를 최대한 활용하여 만들 수 있는 요리 6가지를 추천하세요.
-
-        📌 사용 가능한 재료 목록: {json.dumps(user_ingredients, ensure_ascii=False)}
-
-        필수 조건:
-        - 반드시 사용자가 가진 재료만 사용하세요.
-        - 추가 재료는 절대 포함하지 마세요.
-        - 현실적으로 만들 수 있는 요리만 추천하세요.
-        - 응답은 반드시 JSON 형식이어야 하며, 그 외 설명은 포함하지 마세요.
-
-        참고 예시 (출력은 이 형식만 따르되 내용은 새로 생성):
-        ```json
-        {{
-          "recipes": [
-            {{
-              "food": "계란 볶음밥",
-              "use_ingredients": ["밥", "계란", "대파", "소금", "후춧가루"]
-            }}
-          ]
-        }}
-        ```
-        """
+    def build_suggestion_prompt(user_ingredients: list) -> Prompt:
+        return SUGGEST_TEMPLATE.render(ingredients=json.dumps(user_ingredients, ensure_ascii=False))
 
     @staticmethod
-    def build_recipe_prompt(food: str, ingredients: list) -> str:
-        return f"""
-        당신은 전문 요리사 AI입니다. 사용자가 요청한 음식의 상세 조리법을 제공합니다.
-
-        요청된 음식: {food}  
-        사용 가능한 재료: {json.dumps(ingredients, ensure_ascii=False)}
-
-        필수 조건:
-        - 반드시 요청된 음식과 제공된 재료만 사용하세요.
-        - 재료의 양을 구체적으로 명시하세요. (예: 100g, 1컵 등)
-        - 레시피는 최소 450자 이상, 단계별로 구성하세요.
-        - 추가 팁이 있다면 포함하세요.
-        - 응답은 반드시 JSON 형식이며, 코드 블록 없이 JSON 본문만 출력하세요.
-
-        참고 예시:
-        ```json
-        {{
-          "food": "계란 오믈렛",
-          "use_ingredients": [
-            {{"name": "계란", "amount": "2개"}},
-            {{"name": "양파", "amount": "50g"}},
-            {{"name": "치즈", "amount": "30g"}},
-            {{"name": "우유", "amount": "50ml"}}
-          ],
-          "steps": [
-            "양파를 잘게 썰어 준비합니다.",
-            "볼에 계란을 깨서 우유, 치즈와 섞어줍니다.",
-            "팬에 양파를 볶은 후 혼합물을 붓고 천천히 익힙니다.",
-            "반으로 접고 완성합니다."
-          ],
-          "tip": "우유를 넣으면 더 부드럽게 익습니다."
-        }}
-        ```
-        """
+    def build_recipe_prompt(food: str, ingredients: list) -> Prompt:
+        return RECIPE_TEMPLATE.render(food=food, ingredients=json.dumps(ingredients, ensure_ascii=False))
 
     @staticmethod
-    def build_quick_prompt(chat: str) -> str:
-        return f"""
-        당신은 요리 전문가 AI입니다. 사용자가 입력한 재료를 활용해 만들 수 있는 1가지 요리를 추천하세요.
-
-        입력된 재료: "{chat}"
-
-        필수 조건:
-        - 입력된 재료만 사용하세요.
-        - 음식과 관련 없는 질문, 부적절한 콘텐츠(비속어, 성적, 정치적, 종교적 표현 등)가 포함된 경우 응답하지 마세요.
-        - 조리법은 최소 350자 이상, 단계별로 구성하세요.
-        - 재료의 사용량, 조리 팁을 포함하세요.
-        - 반드시 JSON 형식으로 응답하세요. 코드 블록 없이 본문만 출력하세요.
-
-        잘못된 입력일 경우:
-        {{"error": "정확한 음식명을 입력해 주세요."}}
-
-        참고 예시:
-        {{
-          "food": "치즈 오믈렛",
-          "use_ingredients": [
-            {{"name": "계란", "amount": "2개"}},
-            {{"name": "치즈", "amount": "30g"}},
-            {{"name": "우유", "amount": "50ml"}}
-          ],
-          "steps": ["..."],
-          "tip": "약불에서 천천히 익히세요."
-        }}
-        """
+    def build_quick_prompt(chat: str) -> Prompt:
+        return QUICK_TEMPLATE.render(chat=chat)
 
     @staticmethod
-    def build_search_prompt(chat: str) -> str:
-        return f"""
-        당신은 요리 전문가 AI입니다. 사용자가 입력한 음식명에 대한 정확한 레시피를 제공합니다.
-
-        입력된 음식명: "{chat}"
-
-        필수 조건:
-        - 해당 음식만 다루고, 추천이나 설명은 생략하세요.
-        - 음식과 무관한 질문, 부적절한 콘텐츠(비속어, 성적, 정치적, 종교적 표현 등)가 포함된 경우 응답하지 마세요.
-        - 재료와 양, 조리법, 팁을 포함한 JSON을 제공하세요.
-        - 최소 300자 이상의 단계별 설명 포함.
-        - 반드시 JSON 형식 본문만 응답하세요.
-
-        잘못된 입력일 경우:
-        {{"error": "정확한 음식명을 입력해 주세요."}}
-
-        참고 예시:
-        {{
-          "food": "된장찌개",
-          "use_ingredients": [...],
-          "steps": [...],
-          "tip": "육수에 마늘을 추가하세요."
-        }}
-        """
+    def build_search_prompt(chat: str) -> Prompt:
+        return SEARCH_TEMPLATE.render(chat=chat)
@@ -0,0 +1,384 @@
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import time
+import uuid
+
+from core.config import settings
+from core.connection import RedisClient
+from core.logging import service_log, loggers
+from core.metrics import RECIPE_JOBS, RECIPE_JOB_WAIT
+from cache.recipe_cache import RecipeCache
+from exception.base_exception import CustomException
+from exception.foodthing_exception import (
+    AIServiceBusyException,
+    AIServiceUnavailableException,
+    InvalidAIRequestException,
+    RecipeJobNotFoundException
+)
+from schema.response import RecipeJobSchema
+from service.recipe.foodthing import CookAIService
+from service.recipe.ollama_monitor import OllamaHealthMonitor
+from service.recipe.prompt_builder import Prompt, PromptBuilder
+
+# 비동기 레시피 작업 (생성이 끝날 때까지 HTTP 연결을 잡아두지 않기 위함)
+# POST /recipe/jobs는 작업을 Redis 대기열에 넣고 id만 바로 반환, 워커마다 백그라운드 태스크가 꺼내서 Ollama 호출
+# 상태와 결과는 TTL을 두고 Redis에 보관 -> GET /recipe/jobs/{id}로 조회
+# 같은 유저가 같은 요청을 다시 보내면 (실패한 작업 제외) 기존 작업을 돌려줘 생성을 다시 하지 않음
+# 처리 중인 작업은 updated_at을 주기적으로 갱신, 오래 갱신되지 않은 작업은 실패로 처리 (다시 요청 가능)
+# 꺼낸 작업은 BLMOVE로 워커별 처리 중 목록에 옮겨두고 끝나면 삭제
+# -> 워커가 처리 도중 죽으면 생존 표시가 만료되고, 다음에 시작하는 워커가 그 목록을 대기열로 되돌림
+
+background_logger = loggers["background"]
+error_logger = loggers["error"]
+
+
+class RecipeJobService(CookAIService):
+    # 프롬프트와 캐시 키만 만들어 대기열에 추가 (kind별 입력 검증은 동기 API와 동일)
+    async def submit_job(self, request_data: dict) -> RecipeJobSchema:
+        user = await self._get_authenticated_user()
+        kind = request_data.get("kind")
+
+        service_log("RecipeService", f"AI 레시피 작업 요청: {kind}", user_id=user.id)
+
+        if kind == "suggest":
+            prompt, cache_key = await self._build_suggest(user)
+        elif kind == "cooking":
+            prompt, cache_key = self._build_recipe(request_data)
+        else:
+            chat = request_data.get("chat")
+            if not chat or not chat.strip():
+                raise InvalidAIRequestException(detail="올바른 'chat' 값을 제공해야 합니다.")
+            prompt, cache_key = self._build_quick(chat) if kind == "quick" else self._build_search(chat)
+
+        job = await RecipeJobQueue.submit(user.id, prompt, cache_key)
+        return RecipeJobQueue.to_schema(job)
+
+    async def get_job(self, job_id: str) -> RecipeJobSchema:
+        user = await self._get_authenticated_user()
+        return RecipeJobQueue.to_schema(await RecipeJobQueue.get(user.id, job_id))
+
+    # 대기열에서 꺼낸 작업 실행 (같은 프롬프트의 동기 요청과 겹치면 SingleFlight로 한 번만 생성)
+    async def run_job(self, prompt: Prompt, cache_key: str | None):
+        return await self._generate(prompt, False, cache_key)
+
+
+class RecipeJobQueue:
+    QUEUE_KEY = "recipe:jobs:queue"
+    JOB_KEY_PREFIX = "recipe:jobs:item:"
+    DEDUPE_KEY_PREFIX = "recipe:jobs:dedupe:"
+    PROCESSING_KEY_PREFIX = "recipe:jobs:processing:"   # 워커별 처리 중 작업 목록
+    ALIVE_KEY_PREFIX = "recipe:jobs:alive:"             # 워커 생존 표시 (TTL)
+    WORKERS_KEY = "recipe:jobs:workers"                 # 처리 중 목록을 가진 적 있는 워커 id
+    _tasks: list[asyncio.Task] = []
+    _heartbeat_task: asyncio.Task | None = None
+    _running: bool = False
+    _worker: RecipeJobService | None = None
+    _worker_id: str | None = None
+
+    @classmethod
+    def _job_key(cls, job_id: str) -> str:
+        return cls.JOB_KEY_PREFIX + job_id
+
+    @classmethod
+    def _processing_key(cls, worker_id: str | None = None) -> str:
+        return cls.PROCESSING_KEY_PREFIX + (worker_id or cls._worker_id)
+
+    @classmethod
+    def _dedupe_key(cls, user_id: int, prompt: Prompt) -> str:
+        digest = hashlib.sha256(f"{prompt.version}\n{prompt.text}".encode()).hexdigest()
+        return f"{cls.DEDUPE_KEY_PREFIX}{user_id}:{digest}"
+
+    @staticmethod
+    def to_schema(job: dict) -> RecipeJobSchema:
+        return RecipeJobSchema(
+            job_id=job["id"],
+            status=job["status"],
+            result=job.get("result"),
+            error=job.get("error")
+        )
+
+    # 저장할 때마다 갱신 시각 기록
+    @staticmethod
+    def _dump(job: dict) -> str:
+        job["updated_at"] = time.time()
+        return json.dumps(job, ensure_ascii=False)
+
+    @staticmethod
+    def _is_stale(job: dict) -> bool:
+        updated_at = job.get("updated_at", job["created_at"])
+        return job["status"] in ("queued", "running") and time.time() - updated_at > settings.RECIPE_JOB_STALE_SECONDS
+
+    # 워커가 죽어 멈춘 작업이 같은 요청의 재시도를 막지 않도록 실패로 바꿈
+    @classmethod
+    async def _fail_if_stale(cls, job: dict) -> dict:
+        if cls._is_stale(job):
+            job.update(status="failed", error={
+                "code": "RECIPE_JOB_STALE",
+                "detail": "작업이 제시간에 처리되지 않았습니다. 다시 요청해주세요"
+            })
+            await cls.save(job)
+            RECIPE_JOBS.labels("failed").inc()
+        return job
+
+    @classmethod
+    async def load(cls, job_id: str) -> dict | None:
+        redis = await RedisClient.get_redis()
+        raw = await redis.get(cls._job_key(job_id))
+        return json.loads(raw) if raw else None
+
+    @classmethod
+    async def save(cls, job: dict):
+        redis = await RedisClient.get_redis()
+        await redis.set(cls._job_key(job["id"]), cls._dump(job), ex=settings.RECIPE_JOB_TTL)
+
+    @classmethod
+    async def submit(cls, user_id: int, prompt: Prompt, cache_key: str | None) -> dict:
+        redis = await RedisClient.get_redis()
+        job_id = uuid.uuid4().hex
+        dedupe_key = cls._dedupe_key(user_id, prompt)
+
+        # 같은 요청의 작업이 남아 있으면 그대로 반환 (실패했거나 멈췄거나 만료된 작업이면 새로 생성)
+        if not await redis.set(dedupe_key, job_id, nx=True, ex=settings.RECIPE_JOB_TTL):
+            existing_id = await redis.get(dedupe_key)
+            existing = await cls.load(existing_id) if existing_id else None
+            if existing:
+                existing = await cls._fail_if_stale(existing)
+            if existing and existing["status"] != "failed":
+                return existing
+            await redis.set(dedupe_key, job_id, ex=settings.RECIPE_JOB_TTL)
+
+        job = {
+            "id": job_id,
+            "user_id": user_id,
+            "status": "queued",
+            "kind": prompt.kind,
+            "text": prompt.text,
+            "cache_key": cache_key,
+            "created_at": time.time()
+        }
+
+        # 캐시된 결과가 있으면 대기열을 거치지 않고 바로 완료
+        cached = await RecipeCache.get(cache_key) if cache_key else None
+        if cached is not None:
+            job.update(status="done", result=cached)
+            await cls.save(job)
+            RECIPE_JOBS.labels("cached").inc()
+            return job
+
+        # Ollama 다운 상태거나 대기열이 가득 찼으면 넣지 않고 바로 실패 처리
+        if not OllamaHealthMonitor.is_up:
+            await redis.delete(dedupe_key)
+            raise AIServiceUnavailableException()
+        if await redis.llen(cls.QUEUE_KEY) >= settings.RECIPE_JOB_MAX_QUEUE:
+            await redis.delete(dedupe_key)
+            raise AIServiceBusyException(retry_after=settings.LLM_RETRY_AFTER)
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(cls._job_key(job_id), cls._dump(job), ex=settings.RECIPE_JOB_TTL)
+            pipe.lpush(cls.QUEUE_KEY, job_id)
+            await pipe.execute()
+
+        RECIPE_JOBS.labels("queued").inc()
+        return job
+
+    @classmethod
+    async def get(cls, user_id: int, job_id: str) -> dict:
+        job = await cls.load(job_id)
+        # 다른 유저의 작업은 존재 여부도 알 수 없도록 404
+        if job is None or job["user_id"] != user_id:
+            raise RecipeJobNotFoundException()
+        return await cls._fail_if_stale(job)
+
+    # 처리 끝난 작업 저장 + 처리 중 목록에서 삭제
+    @classmethod
+    async def _finish(cls, job: dict):
+        redis = await RedisClient.get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(cls._job_key(job["id"]), cls._dump(job), ex=settings.RECIPE_JOB_TTL)
+            pipe.lrem(cls._processing_key(), 1, job["id"])
+            await pipe.execute()
+
+    # 처리 중 목록에서 대기열 맨 앞으로 되돌림 (오른쪽에서 꺼내므로 RPUSH), 이미 끝난 작업은 목록에서만 삭제
+    @classmethod
+    async def _requeue(cls, job_id: str):
+        redis = await RedisClient.get_redis()
+        job = await cls.load(job_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(cls._processing_key(), 1, job_id)
+            if job is not None and job["status"] not in ("done", "failed"):
+                job["status"] = "queued"
+                pipe.set(cls._job_key(job_id), cls._dump(job), ex=settings.RECIPE_JOB_TTL)
+                pipe.rpush(cls.QUEUE_KEY, job_id)
+            await pipe.execute()
+
+    @classmethod
+    async def _run_job(cls, job_id: str):
+        job = await cls.load(job_id)
+        if job is None:   # 처리 전에 만료된 작업
+            redis = await RedisClient.get_redis()
+            await redis.lrem(cls._processing_key(), 1, job_id)
+            return
+        # 오래 기다려 이미 실패로 알린 작업은 생성하지 않음
+        job = await cls._fail_if_stale(job)
+        if job["status"] in ("done", "failed"):   # 완료 저장 직후 워커가 죽어 되돌려진 작업 포함
+            await cls._finish(job)
+            return
+
+        if "started_at" not in job:
+            job["started_at"] = time.time()
+            RECIPE_JOB_WAIT.observe(max(job["started_at"] - job["created_at"], 0))
+        job["status"] = "running"
+        await cls.save(job)
+
+        # 대기 중에 템플릿이 바뀌었어도 채워둔 본문은 그대로 사용
+        prompt = PromptBuilder.TEMPLATES[job["kind"]].with_text(job["text"])
+
+        try:
+            result = await cls._generate(job, prompt)
+        except CustomException as e:
+            if cls._is_overloaded(e):
+                # 처리 슬롯이 없어 거절된 경우는 실패시키지 않고 잠시 후 다시 처리
+                await cls._requeue(job_id)
+                await asyncio.sleep(settings.RECIPE_JOB_RETRY_AFTER)
+                return
+            e.log(error_logger, f"recipe job {job_id}")
+            job.update(status="failed", error={"code": e.code, "detail": e.detail})
+        except Exception as e:
+            error_logger.error(f"[RecipeJob] {job_id} 처리 중 오류: {type(e).__name__}: {str(e)}")
+            job.update(status="failed", error={"code": "AI_SERVICE_ERROR", "detail": "레시피 생성 중 오류가 발생했습니다"})
+        else:
+            job.update(status="done", result=result)
+
+        RECIPE_JOBS.labels(job["status"]).inc()
+        await cls._finish(job)
+
+    # 일시적인 과부하 거절 (대기열 가득 참 429, 대기 시간 초과/모든 노드 제외 503 + Retry-After)
+    # 다른 워커에서 SingleFlight로 전달된 에러도 code와 헤더로 판단
+    @staticmethod
+    def _is_overloaded(e: CustomException) -> bool:
+        if isinstance(e, AIServiceBusyException) or e.code == "AI_SERVICE_BUSY":
+            return True
+        return e.status_code == 503 and bool(e.headers) and "Retry-After" in e.headers
+
+    # 처리 중인 작업의 갱신 시각을 주기적으로 저장 (멈춘 작업과 구분)
+    @classmethod
+    async def _touch(cls, job: dict):
+        while True:
+            await asyncio.sleep(settings.RECIPE_JOB_STALE_SECONDS / 5)
+            try:
+                await cls.save(job)
+            except Exception as e:
+                background_logger.warning(f"레시피 작업 상태 갱신 실패: {e}")
+
+    # 생성하는 동안만 갱신 시각 저장 (끝나면 먼저 멈춰야 이후 저장한 상태를 덮어쓰지 않음)
+    @classmethod
+    async def _generate(cls, job: dict, prompt: Prompt):
+        heartbeat = asyncio.create_task(cls._touch(job))
+        try:
+            return await cls._worker.run_job(prompt, job["cache_key"])
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+    @classmethod
+    async def _process(cls, job_id: str):
+        try:
+            await cls._run_job(job_id)
+        except asyncio.CancelledError:
+            # 워커 종료로 중단되면 다른 워커가 이어서 처리하도록 되돌림
+            await cls._requeue(job_id)
+            raise
+
+    @classmethod
+    async def _consume(cls):
+        while cls._running:
+            try:
+                redis = await RedisClient.get_redis()
+                # 짧게 대기하며 반복 (소켓 타임아웃보다 짧아야 연결 오류로 처리되지 않음)
+                job_id = await redis.blmove(
+                    cls.QUEUE_KEY,
+                    cls._processing_key(),
+                    settings.RECIPE_JOB_POLL_TIMEOUT,
+                    "RIGHT",
+                    "LEFT"
+                )
+                if job_id:
+                    await cls._process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                background_logger.error(f"레시피 작업 처리 중 오류: {e}")
+                await asyncio.sleep(settings.RECIPE_JOB_RETRY_AFTER)
+
+    # 워커 생존 표시 갱신 (이 워커가 죽으면 TTL 뒤 처리 중 목록이 회수 대상이 됨)
+    @classmethod
+    async def _heartbeat(cls):
+        while True:
+            try:
+                redis = await RedisClient.get_redis()
+                await redis.set(cls.ALIVE_KEY_PREFIX + cls._worker_id, 1, ex=settings.RECIPE_JOB_WORKER_TTL)
+            except Exception as e:
+                background_logger.warning(f"레시피 작업 워커 생존 표시 실패: {e}")
+            await asyncio.sleep(settings.RECIPE_JOB_WORKER_TTL / 3)
+
+    # 생존 표시가 없는 워커의 처리 중 작업을 대기열 맨 앞으로 되돌림
+    @classmethod
+    async def _recover(cls) -> int:
+        redis = await RedisClient.get_redis()
+        recovered = 0
+        for worker_id in await redis.smembers(cls.WORKERS_KEY):
+            if worker_id == cls._worker_id or await redis.exists(cls.ALIVE_KEY_PREFIX + worker_id):
+                continue
+            processing_key = cls._processing_key(worker_id)
+            while await redis.lmove(processing_key, cls.QUEUE_KEY, "RIGHT", "RIGHT"):
+                recovered += 1
+            await redis.srem(cls.WORKERS_KEY, worker_id)
+        return recovered
+
+    @classmethod
+    async def start(cls):
+        # 백그라운드 작업은 요청/유저 정보 없이 생성만 수행
+        cls._worker = RecipeJobService(None, None, None, None)
+        cls._worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        redis = await RedisClient.get_redis()
+        await redis.set(cls.ALIVE_KEY_PREFIX + cls._worker_id, 1, ex=settings.RECIPE_JOB_WORKER_TTL)
+        await redis.sadd(cls.WORKERS_KEY, cls._worker_id)
+        recovered = await cls._recover()
+        if recovered:
+            background_logger.warning(f"중단된 레시피 작업 {recovered}개를 대기열로 되돌렸습니다")
+
+        cls._running = True
+        cls._heartbeat_task = asyncio.create_task(cls._heartbeat())
+        cls._tasks = [asyncio.create_task(cls._consume()) for _ in range(settings.RECIPE_JOB_CONSUMERS)]
+
+    @classmethod
+    async def stop(cls):
+        # 대기 중인 태스크는 BLMOVE가 끝나면 스스로 종료, 처리 중인 작업은 취소 후 대기열로 되돌림
+        cls._running = False
+        if cls._tasks:
+            _, pending = await asyncio.wait(cls._tasks, timeout=settings.RECIPE_JOB_POLL_TIMEOUT + 1)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*cls._tasks, return_exceptions=True)
+            cls._tasks = []
+
+        # 소비 태스크가 없어도 (RECIPE_JOB_CONSUMERS=0) 생존 표시와 워커 등록은 정리
+        if cls._heartbeat_task:
+            cls._heartbeat_task.cancel()
+            await asyncio.gather(cls._heartbeat_task, return_exceptions=True)
+            cls._heartbeat_task = None
+        if cls._worker_id is None:
+            return
+
+        # 처리 중 목록이 비어 있으면 회수 대상에서 제외
+        try:
+            redis = await RedisClient.get_redis()
+            if not await redis.llen(cls._processing_key()):
+                await redis.srem(cls.WORKERS_KEY, cls._worker_id)
+            await redis.delete(cls.ALIVE_KEY_PREFIX + cls._worker_id)
+        except Exception as e:
+            background_logger.warning(f"레시피 작업 워커 정리 실패: {e}")
@@ -19,11 +19,13 @@ from exception.user_exception import (
 )
 
 from core.logging import security_log
+from core.executor import PasswordHashPool
 from core.config import settings
 from database.repository.user_repository import UserRepository
 from database.orm import User
 from schema.request import SignUpRequest, LogInRequest
-from schema.response import UserSchema, JWTResponse
+from schema.response import UserSchema, JWTResponse, AuthUserSchema
+from cache.user_cache import UserCache
 
 
 class UserService:
@@ -35,17 +37,19 @@ class UserService:
     def __init__(self, user_repo: UserRepository):
         self.user_repo = user_repo
 
-    # 비밀번호 해쉬 처리
-    def hash_password(self, plain_password: str) -> str:
-        hashed_password: bytes = bcrypt.hashpw(
+    # 비밀번호 해쉬 처리 (이벤트 루프를 막지 않도록 전용 스레드 풀에서 실행)
+    async def hash_password(self, plain_password: str) -> str:
+        hashed_password: bytes = await PasswordHashPool.run(
+            bcrypt.hashpw,
             plain_password.encode(self.encoding),
-            salt=bcrypt.gensalt(),
+            bcrypt.gensalt(),
         )
         return hashed_password.decode(self.encoding)
 
     # 해쉬 검증
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await PasswordHashPool.run(
+            bcrypt.checkpw,
             plain_password.encode(self.encoding),
             hashed_password.encode(self.encoding)
         )
@@ -87,11 +91,16 @@ class UserService:
             )
             raise TokenExpiredException()
 
-    async def change_password(self, user: User, current_password: str, new_password: str, confirm_new_password: str):
-        if not self.verify_password(current_password, user.password):
+    async def change_password(self, user: AuthUserSchema, current_password: str, new_password: str, confirm_new_password: str):
+        # 캐시된 유저 정보에는 비밀번호가 없으므로 DB에서 다시 조회
+        user: User | None = await self.user_repo.get_user_by_email(email=user.email)
+        if not user:
+            raise UserNotFoundException()
+
+        if not await self.verify_password(current_password, user.password):
             raise IncorrectPasswordException()
 
-        if self.verify_password(new_password, user.password):
+        if await self.verify_password(new_password, user.password):
             raise PasswordUnchangedException()
 
         if new_password != confirm_new_password:
@@ -100,7 +109,7 @@ class UserService:
         if len(new_password) < 8 or len(new_password) > 20:
             raise PasswordLengthException()
 
-        hashed = self.hash_password(new_password)
+        hashed = await self.hash_password(new_password)
         await self.user_repo.update_password(user, hashed)
 
     # 회원가입 관련
@@ -113,7 +122,7 @@ class UserService:
             if await self.user_repo.get_user_by_nickname(request.nickname): # 닉네임 중복
                 raise DuplicateNicknameException()
 
-            hashed_password = self.hash_password(request.password)
+            hashed_password = await self.hash_password(request.password)
 
             user = User.create(
                 email=request.email,
@@ -144,7 +153,7 @@ class UserService:
             )
             raise InvalidCredentialsException()
 
-        verified = self.verify_password(request.password, user.password)
+        verified = await self.verify_password(request.password, user.password)
         if not verified:
             if not verified:
                 security_log(
@@ -157,9 +166,14 @@ class UserService:
         access_token = self.create_jwt(email=user.email)
         return JWTResponse(access_token=access_token)
 
-    # 유저의 토큰 조회
-    async def get_user_by_token(self, access_token: str, req: Request) -> User:
+    # 유저의 토큰 조회 (유저 캐시에 있으면 DB 조회 생략)
+    async def get_user_by_token(self, access_token: str, req: Request) -> AuthUserSchema:
         email: str = self.decode_jwt(access_token=access_token, req=req)
+
+        cached = await UserCache.get(email)
+        if cached:
+            return cached
+
         user: User | None = await self.user_repo.get_user_by_email(email=email)
         if not user:
             security_log(
@@ -168,4 +182,7 @@ class UserService:
                 ip=req.client.host
             )
             raise UserNotFoundException()
-        return user
\ No newline at end of file
+
+        identity = AuthUserSchema.model_validate(user)
+        await UserCache.set(identity)
+        return identity